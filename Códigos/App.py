@@ -1,125 +1,527 @@
-import tkinter as tk
-from tkinter import messagebox
+import re
+from bisect import bisect_right
+from itertools import islice
 
-# Función para convertir infija a postfija (con actualización en la interfaz)
-def infija_a_postfija(expresion):
-    precedencia = {'+': 1, '-': 1, '*': 2, '/': 2, '^': 3}
-    salida = []  # Aquí guardaremos el resultado final
-    pila = []  # Pila para manejar los operadores
-    tokens = list(expresion.replace(" ", ""))  # Separamos cada elemento
 
-    # Limpiamos la caja de texto antes de empezar
-    pasos_texto.delete("1.0", tk.END)
+# Tabla de operadores: precedencia y asociatividad
+precedencia = {'+': 1, '-': 1, '*': 2, '/': 2, '^': 3}
+asociativos_derecha = {'^'}
+
+# Números (con decimales), identificadores de varios caracteres u otro símbolo suelto
+_patron_tokens = re.compile(r'\d+(?:\.\d+)?|\w+|\S')
+
+
+def tokenizar(expresion):
+    return _patron_tokens.findall(expresion)
+
+
+def es_operando(token):
+    return token[0].isalnum() or token[0] == '_'
+
+
+# Motor de conversión infija -> postfija (shunting-yard), sin interfaz gráfica.
+# Cada token se apila y desapila una sola vez, así que el tiempo es lineal.
+# Si registrar_pasos es True, devuelve también la lista de pasos: cada paso
+# guarda sus mensajes, cuántos tokens tenía la salida y la pila en ese momento.
+# La pila es una lista enlazada inmutable de tuplas (cima, resto), así que
+# guardarla en cada paso cuesta O(1) y el registro completo sigue siendo lineal.
+# Lanza ValueError si la expresión infija no es válida: operandos y operadores
+# deben alternarse, así "a + + b" o "( a b )" no producen una postfija
+def convertir_infija_a_postfija(tokens, registrar_pasos=False):
+    salida = []  # Aquí guardaremos el resultado final
+    pila = None  # Pila de operadores: (cima, resto) o None si está vacía
+    pasos = [] if registrar_pasos else None
+    espera_operando = True  # Al inicio, tras un operador y tras '(' va un operando
 
     for token in tokens:
-        if token.isalnum():  # Si es un número o una variable
+        mensajes = []
+        if es_operando(token):  # Si es un número o una variable
+            if not espera_operando:
+                raise ValueError("Expresión infija inválida")
+            espera_operando = False
             salida.append(token)
-            pasos_texto.insert(tk.END, f"Agregado a la salida: {token}\n")
+            mensajes.append(f"Agregado a la salida: {token}")
         elif token in precedencia:  # Si es un operador
-            while pila and pila[-1] != '(' and precedencia.get(pila[-1], 0) >= precedencia[token]:
-                salida.append(pila.pop())  # Sacamos operadores con mayor prioridad
-                pasos_texto.insert(tk.END, f"Operador sacado y agregado a la salida\n")
-            pila.append(token)  # Ponemos el operador actual en la pila
-            pasos_texto.insert(tk.END, f"Operador {token} agregado a la pila\n")
+            if espera_operando:
+                raise ValueError("Expresión infija inválida")
+            espera_operando = True
+            actual = precedencia[token]
+            derecha = token in asociativos_derecha
+            while pila and pila[0] != '(':
+                cima = precedencia[pila[0]]
+                if cima < actual or (derecha and cima == actual):
+                    break
+                salida.append(pila[0])  # Sacamos operadores con mayor prioridad
+                pila = pila[1]
+                mensajes.append("Operador sacado y agregado a la salida")
+            pila = (token, pila)  # Ponemos el operador actual en la pila
+            mensajes.append(f"Operador {token} agregado a la pila")
         elif token == '(':
-            pila.append(token)
-            pasos_texto.insert(tk.END, "Paréntesis de apertura agregado a la pila\n")
+            if not espera_operando:
+                raise ValueError("Expresión infija inválida")
+            pila = (token, pila)
+            mensajes.append("Paréntesis de apertura agregado a la pila")
         elif token == ')':
-            while pila and pila[-1] != '(':
-                salida.append(pila.pop())  # Sacamos operadores hasta encontrar '('
-                pasos_texto.insert(tk.END, "Operador sacado y agregado a la salida\n")
-            pila.pop()  # Quitamos el '(' de la pila
-            pasos_texto.insert(tk.END, "Paréntesis de apertura eliminado de la pila\n")
+            if espera_operando:
+                raise ValueError("Expresión infija inválida")
+            while pila and pila[0] != '(':
+                salida.append(pila[0])  # Sacamos operadores hasta encontrar '('
+                pila = pila[1]
+                mensajes.append("Operador sacado y agregado a la salida")
+            if not pila:
+                raise ValueError("Paréntesis desbalanceados")
+            pila = pila[1]  # Quitamos el '(' de la pila
+            mensajes.append("Paréntesis de apertura eliminado de la pila")
+        else:
+            raise ValueError(f"Símbolo no válido: {token}")
 
-        # 🔹 Mostramos el estado actual después de cada paso
-        pasos_texto.insert(tk.END, f"Salida actual: {' '.join(salida)}\n")
-        pasos_texto.insert(tk.END, f"Pila actual: {pila}\n\n")
-        ventana.update()  # 🔹 Actualiza la interfaz en cada paso
+        if registrar_pasos:
+            pasos.append((mensajes, len(salida), pila))
 
+    if espera_operando:  # Vacía o terminada en operador
+        raise ValueError("Expresión infija inválida")
     while pila:  # Al final, vaciamos la pila
-        salida.append(pila.pop())
-        pasos_texto.insert(tk.END, f"Operador final sacado y agregado a la salida\n")
-        pasos_texto.insert(tk.END, f"Salida actual: {' '.join(salida)}\n")
-        pasos_texto.insert(tk.END, f"Pila actual: {pila}\n\n")
-        ventana.update()
+        if pila[0] == '(':
+            raise ValueError("Paréntesis desbalanceados")
+        salida.append(pila[0])
+        pila = pila[1]
+        if registrar_pasos:
+            pasos.append((["Operador final sacado y agregado a la salida"], len(salida), pila))
+
+    return salida, pasos
+
+
+def formatear_paso(paso, salida, limite=None):
+    # Texto de un paso tal como lo muestra la interfaz. Con limite solo se
+    # muestran los últimos 'limite' tokens de la salida y de la pila, para que
+    # formatear un paso no cueste O(n) en expresiones enormes
+    mensajes, longitud, pila = paso
+    inicio = 0 if limite is None else max(0, longitud - limite)
+    contenido = []
+    while pila and (limite is None or len(contenido) < limite):
+        contenido.append(pila[0])
+        pila = pila[1]
+    contenido.reverse()
+    salida_actual = " ".join(salida[inicio:longitud])
+    pila_actual = str(contenido)
+    if inicio:
+        salida_actual = "… " + salida_actual
+    if pila:
+        pila_actual = "[…, " + pila_actual[1:] if contenido else "[…]"
+    return ("".join(f"{mensaje}\n" for mensaje in mensajes)
+            + f"Salida actual: {salida_actual}\n"
+            + f"Pila actual: {pila_actual}\n\n")
+
+
+# Bitácora de pasos en memoria: guarda los pasos sin formatear y entrega solo
+# las líneas que se piden, así la interfaz dibuja únicamente las visibles
+class Bitacora:
+    def __init__(self):
+        self.bloques = []  # Texto ya formateado o (formatear, paso, contexto) sin formatear
+        self.inicios = []  # Línea donde empieza cada bloque
+        self.total_lineas = 0
+
+    def agregar(self, texto):
+        self.bloques.append(texto)
+        self.inicios.append(self.total_lineas)
+        self.total_lineas += texto.count("\n")
+
+    def agregar_pasos(self, pasos, contexto, formatear=formatear_paso, lineas_por_paso=None):
+        # formatear(paso, contexto, limite) da el texto del paso cuando se dibuja.
+        # Por omisión son pasos de la conversión a postfija: sus mensajes más
+        # "Salida actual", "Pila actual" y una línea vacía
+        for paso in pasos:
+            self.bloques.append((formatear, paso, contexto))
+            self.inicios.append(self.total_lineas)
+            self.total_lineas += len(paso[0]) + 3 if lineas_por_paso is None else lineas_por_paso
+
+    def lineas(self, primera, cantidad, limite=None):
+        # Devuelve las líneas [primera, primera + cantidad) sin el salto final
+        resultado = []
+        indice = bisect_right(self.inicios, primera) - 1
+        saltar = primera - self.inicios[indice] if indice >= 0 else 0
+        indice = max(indice, 0)
+        while len(resultado) < cantidad and indice < len(self.bloques):
+            bloque = self.bloques[indice]
+            if isinstance(bloque, tuple):
+                formatear, paso, contexto = bloque
+                bloque = formatear(paso, contexto, limite)
+            resultado.extend(bloque.split("\n")[saltar:-1])
+            saltar = 0
+            indice += 1
+        return resultado[:cantidad]
 
+
+# Función para convertir infija a postfija
+# mostrar_paso (opcional) recibe el texto de cada paso; sin él no se registran pasos
+def infija_a_postfija(expresion, mostrar_paso=None):
+    salida, pasos = convertir_infija_a_postfija(tokenizar(expresion), mostrar_paso is not None)
+    if mostrar_paso:
+        for paso in pasos:
+            mostrar_paso(formatear_paso(paso, salida))
     return " ".join(salida)
 
 
-# Función para convertir postfija a infija (con actualización en la interfaz)
-def postfija_a_infija(expresion):
+# Árbol de una expresión postfija: cada operador es una tupla
+# (operador, izquierda, derecha) y cada operando es su token
+# Lanza ValueError si la expresión postfija no es válida
+def construir_arbol_postfija(tokens):
     pila = []
-    tokens = expresion.split()
+    for token in tokens:
+        if es_operando(token):
+            pila.append(token)
+        elif token in precedencia and len(pila) >= 2:
+            derecha = pila.pop()
+            pila[-1] = (token, pila[-1], derecha)
+        else:
+            raise ValueError("Expresión postfija inválida")
+    if len(pila) != 1:
+        raise ValueError("Expresión postfija inválida")
+    return pila[0]
+
+
+def _precedencia_nodo(nodo):
+    # Los operandos nunca necesitan paréntesis
+    return precedencia[nodo[0]] if isinstance(nodo, tuple) else len(precedencia) + 1
+
+
+# Produce el árbol en infija por partes, sin recursión (con una pila de trabajo)
+# para que no haya límite de profundidad. Con parentesis_minimos solo se agregan
+# los paréntesis que exigen la precedencia y la asociatividad; si no, cada
+# operación va entre paréntesis como en la conversión paso a paso
+def _partes_infija(arbol, parentesis_minimos):
+    pendientes = [arbol]
+    while pendientes:
+        nodo = pendientes.pop()
+        if not isinstance(nodo, tuple):  # Operando o texto ya listo
+            yield nodo
+            continue
+        operador, izquierda, derecha = nodo
+        if parentesis_minimos:
+            actual = precedencia[operador]
+            derecha_asociativa = operador in asociativos_derecha
+            envolver_izquierda = (_precedencia_nodo(izquierda) < actual
+                                  or (derecha_asociativa and _precedencia_nodo(izquierda) == actual))
+            envolver_derecha = (_precedencia_nodo(derecha) < actual
+                                or (not derecha_asociativa and _precedencia_nodo(derecha) == actual))
+        else:
+            yield "("
+            pendientes.append(")")
+            envolver_izquierda = envolver_derecha = False
+        # Se apilan al revés para que salgan en orden: izquierda, operador, derecha
+        if envolver_derecha:
+            pendientes.extend([")", derecha, "("])
+        else:
+            pendientes.append(derecha)
+        pendientes.append(f" {operador} ")
+        if envolver_izquierda:
+            pendientes.extend([")", izquierda, "("])
+        else:
+            pendientes.append(izquierda)
 
-    # Limpiamos la caja de texto antes de empezar
-    pasos_texto.delete("1.0", tk.END)
 
+# Escribe el árbol en infija en una sola pasada
+def arbol_a_infija(arbol, parentesis_minimos=True):
+    return "".join(_partes_infija(arbol, parentesis_minimos))
+
+
+def _infija_recortada(arbol, limite):
+    # Subexpresión con todos sus paréntesis; con limite, solo sus primeras
+    # 'limite' partes. Devuelve (texto, partes usadas)
+    if limite is None:
+        return arbol_a_infija(arbol, False), 0
+    partes = list(islice(_partes_infija(arbol, False), limite + 1))
+    if len(partes) > limite:
+        return "".join(partes[:limite]).rstrip() + " …", limite
+    return "".join(partes), len(partes)
+
+
+# Motor de conversión postfija -> infija: arma el árbol y, si registrar_pasos
+# es True, guarda como paso la pila de subárboles después de cada token. La
+# pila es una lista enlazada inmutable (cima, resto), como en la conversión a
+# postfija, así que registrar todos los pasos sigue siendo lineal; el texto de
+# cada paso se arma solo al mostrarlo (formatear_paso_infija)
+# Lanza ValueError si la expresión postfija no es válida
+def convertir_postfija_a_infija(tokens, registrar_pasos=False):
+    if not registrar_pasos:
+        return construir_arbol_postfija(tokens), None
+    pila = None
+    altura = 0
+    pasos = []
     for token in tokens:
-        if token.isalnum():  # Si es un número o variable, lo agregamos a la pila
-            pila.append(token)
-            pasos_texto.insert(tk.END, f"Operando {token} agregado a la pila\n")
-        elif token in "+-*/^":  # Si es un operador
-            if len(pila) < 2:
-                messagebox.showerror("Error", "Expresión postfija inválida")
-                return ""
-            b = pila.pop()
-            a = pila.pop()
-            nueva_expr = f"({a} {token} {b})"
-            pila.append(nueva_expr)
-            pasos_texto.insert(tk.END, f"Se combinaron '{a}' y '{b}' con operador '{token}' -> {nueva_expr}\n")
-
-        # 🔹 Mostramos el estado actual después de cada paso
-        pasos_texto.insert(tk.END, f"Pila actual: {pila}\n\n")
-        ventana.update()
+        if es_operando(token):  # Si es un número o variable, lo agregamos a la pila
+            pila = (token, pila)
+            altura += 1
+        elif token in precedencia and altura >= 2:  # Un operador combina las dos cimas
+            derecha, (izquierda, resto) = pila
+            pila = ((token, izquierda, derecha), resto)
+            altura -= 1
+        else:
+            raise ValueError("Expresión postfija inválida")
+        pasos.append(pila)
+    if altura != 1:
+        raise ValueError("Expresión postfija inválida")
+    return pila[0], pasos
 
-    if len(pila) != 1:
-        messagebox.showerror("Error", "Expresión postfija inválida")
-        return ""
 
+def formatear_paso_infija(paso, contexto=None, limite=None):
+    # Texto de un paso tal como lo muestra la interfaz. Con limite cada
+    # subexpresión se corta tras 'limite' partes y la pila muestra solo sus
+    # elementos más altos, así formatear un paso no cuesta O(n)
+    cima = paso[0]
+    if isinstance(cima, tuple):
+        operador, izquierda, derecha = cima
+        a, _ = _infija_recortada(izquierda, limite)
+        b, _ = _infija_recortada(derecha, limite)
+        nueva_expr, _ = _infija_recortada(cima, limite)
+        mensaje = f"Se combinaron '{a}' y '{b}' con operador '{operador}' -> {nueva_expr}\n"
+    else:
+        mensaje = f"Operando {cima} agregado a la pila\n"
+    contenido = []
+    restante = limite
+    pila = paso
+    while pila and (limite is None or restante > 0):
+        texto, usadas = _infija_recortada(pila[0], restante)
+        contenido.append(texto)
+        if limite is not None:
+            restante -= usadas
+        pila = pila[1]
+    contenido.reverse()
+    pila_actual = str(contenido)
+    if pila:
+        pila_actual = "[…, " + pila_actual[1:] if contenido else "[…]"
+    return mensaje + f"Pila actual: {pila_actual}\n\n"
+
+
+# Función para convertir postfija a infija
+# mostrar_paso (opcional) recibe el texto de cada paso; sin él no se registran pasos
+# Lanza ValueError si la expresión postfija no es válida
+def postfija_a_infija(expresion, mostrar_paso=None, parentesis_minimos=False):
+    tokens = tokenizar(expresion) if isinstance(expresion, str) else expresion
+    arbol, pasos = convertir_postfija_a_infija(tokens, mostrar_paso is not None)
+    if mostrar_paso:
+        for paso in pasos:
+            mostrar_paso(formatear_paso_infija(paso))
+    return arbol_a_infija(arbol, parentesis_minimos)
+
+
+# === Notación prefija (polaca) ===
+# Todas las conversiones pasan por el mismo árbol de tuplas, con la misma tabla
+# de precedencia y el mismo tokenizador; cada paso es lineal y sin recursión
+
+# Lanza ValueError si la expresión prefija no es válida
+def construir_arbol_prefija(tokens):
+    pila = []
+    for token in reversed(tokens):  # De derecha a izquierda, como una postfija al revés
+        if es_operando(token):
+            pila.append(token)
+        elif token in precedencia and len(pila) >= 2:
+            izquierda = pila.pop()
+            pila[-1] = (token, izquierda, pila[-1])
+        else:
+            raise ValueError("Expresión prefija inválida")
+    if len(pila) != 1:
+        raise ValueError("Expresión prefija inválida")
     return pila[0]
 
 
-# Función para convertir la expresión ingresada a postfija y mostrar los pasos
-def convertir_a_postfija():
-    expresion = entrada.get()
-    if not expresion:
-        messagebox.showerror("Error", "Ingrese una expresión")
-        return
-    resultado = infija_a_postfija(expresion)
-    resultado_label.config(text=f"Postfija: {resultado}")
+def construir_arbol_infija(tokens):
+    salida, _ = convertir_infija_a_postfija(tokens)
+    return construir_arbol_postfija(salida)
+
+
+def arbol_a_prefija(arbol):
+    # Preorden: operador, izquierda, derecha
+    tokens = []
+    pendientes = [arbol]
+    while pendientes:
+        nodo = pendientes.pop()
+        if isinstance(nodo, tuple):
+            tokens.append(nodo[0])
+            pendientes.append(nodo[2])
+            pendientes.append(nodo[1])
+        else:
+            tokens.append(nodo)
+    return tokens
+
+
+def arbol_a_postfija(arbol):
+    # Postorden: es el preorden de (operador, derecha, izquierda) leído al revés
+    tokens = []
+    pendientes = [arbol]
+    while pendientes:
+        nodo = pendientes.pop()
+        if isinstance(nodo, tuple):
+            tokens.append(nodo[0])
+            pendientes.append(nodo[1])
+            pendientes.append(nodo[2])
+        else:
+            tokens.append(nodo)
+    tokens.reverse()
+    return tokens
+
+
+def _tokens(expresion):
+    return tokenizar(expresion) if isinstance(expresion, str) else expresion
+
+
+def infija_a_prefija(expresion):
+    return " ".join(arbol_a_prefija(construir_arbol_infija(_tokens(expresion))))
+
+
+def prefija_a_infija(expresion, parentesis_minimos=False):
+    return arbol_a_infija(construir_arbol_prefija(_tokens(expresion)), parentesis_minimos)
+
+
+def prefija_a_postfija(expresion):
+    return " ".join(arbol_a_postfija(construir_arbol_prefija(_tokens(expresion))))
+
+
+def postfija_a_prefija(expresion):
+    return " ".join(arbol_a_prefija(construir_arbol_postfija(_tokens(expresion))))
+
+
+notaciones = {
+    "infija": construir_arbol_infija,
+    "postfija": construir_arbol_postfija,
+    "prefija": construir_arbol_prefija,
+}
+
+
+# Convierte entre dos notaciones cualesquiera ("infija", "postfija" o "prefija")
+def convertir(expresion, origen, destino, parentesis_minimos=False):
+    tokens = _tokens(expresion)
+    if origen == "infija" and destino == "postfija":
+        return " ".join(convertir_infija_a_postfija(tokens)[0])  # No hace falta el árbol
+    arbol = notaciones[origen](tokens)
+    if destino == "infija":
+        return arbol_a_infija(arbol, parentesis_minimos)
+    if destino == "postfija":
+        return " ".join(arbol_a_postfija(arbol))
+    return " ".join(arbol_a_prefija(arbol))
+
+
+# Interfaz gráfica: Tkinter se importa aquí para que las conversiones se puedan
+# usar sin cargarlo
+REPINTADOS_POR_SEGUNDO = 30  # Repintados como máximo al desplazarse; cada uno debe caber en 1/30 s
+LINEAS_VISIBLES = 20
+TOKENS_POR_LINEA = 40  # Tokens de la salida y la pila que se muestran por paso
+
+
+def main(repintados_por_segundo=REPINTADOS_POR_SEGUNDO):
+    import tkinter as tk
+    from tkinter import messagebox
+
+    # Los pasos se guardan en la bitácora y el cuadro de texto solo muestra las
+    # líneas visibles; la barra de desplazamiento recorre la bitácora completa
+    estado = {"bitacora": Bitacora(), "primera": 0, "repintado_pendiente": False}
+
+    def repintar():
+        bitacora = estado["bitacora"]
+        total = max(bitacora.total_lineas, 1)
+        estado["primera"] = max(0, min(estado["primera"], bitacora.total_lineas - LINEAS_VISIBLES))
+        lineas = bitacora.lineas(estado["primera"], LINEAS_VISIBLES, TOKENS_POR_LINEA)
+        pasos_texto.delete("1.0", tk.END)
+        pasos_texto.insert(tk.END, "\n".join(lineas))
+        barra.set(estado["primera"] / total, min(1.0, (estado["primera"] + LINEAS_VISIBLES) / total))
+
+    def desplazar(accion, cantidad, unidad=None):
+        if accion == "moveto":
+            estado["primera"] = int(float(cantidad) * estado["bitacora"].total_lineas)
+        else:
+            paso = LINEAS_VISIBLES if unidad == "pages" else 1
+            estado["primera"] += int(cantidad) * paso
+        pedir_repintado()
+
+    def pedir_repintado():
+        # 🔹 Los desplazamientos se juntan: se redibuja como mucho
+        # repintados_por_segundo veces por segundo, no en cada evento
+        if not estado["repintado_pendiente"]:
+            estado["repintado_pendiente"] = True
+            ventana.after(max(1, 1000 // repintados_por_segundo), repintar_pendiente)
+
+    def repintar_pendiente():
+        estado["repintado_pendiente"] = False
+        repintar()
+
+    def rueda(evento):
+        if getattr(evento, "num", None) == 4 or getattr(evento, "delta", 0) > 0:
+            desplazar("scroll", -3)
+        else:
+            desplazar("scroll", 3)
+        return "break"  # El cuadro de texto no debe desplazarse por su cuenta
+
+    def empezar_bitacora():
+        estado["bitacora"] = Bitacora()
+        estado["primera"] = 0
+
+    # Función para convertir la expresión ingresada a postfija y mostrar los pasos
+    def convertir_a_postfija():
+        expresion = entrada.get()
+        if not expresion:
+            messagebox.showerror("Error", "Ingrese una expresión")
+            return
+        empezar_bitacora()
+        try:
+            salida, pasos = convertir_infija_a_postfija(tokenizar(expresion), registrar_pasos=True)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        estado["bitacora"].agregar_pasos(pasos, salida)
+        repintar()
+        resultado_label.config(text=f"Postfija: {' '.join(salida)}")
 
+    # Función para convertir la expresión ingresada a infija y mostrar los pasos
+    def convertir_a_infija():
+        expresion = entrada.get()
+        if not expresion:
+            messagebox.showerror("Error", "Ingrese una expresión")
+            return
+        empezar_bitacora()
+        try:
+            arbol, pasos = convertir_postfija_a_infija(tokenizar(expresion), registrar_pasos=True)
+        except ValueError as e:
+            repintar()
+            messagebox.showerror("Error", str(e))
+            return
+        # Cada paso ocupa su mensaje, "Pila actual" y una línea vacía
+        estado["bitacora"].agregar_pasos(pasos, None, formatear_paso_infija, lineas_por_paso=3)
+        repintar()
+        resultado_label.config(text=f"Infija: {arbol_a_infija(arbol, parentesis_minimos.get())}")
 
-# Función para convertir la expresión ingresada a infija y mostrar los pasos
-def convertir_a_infija():
-    expresion = entrada.get()
-    if not expresion:
-        messagebox.showerror("Error", "Ingrese una expresión")
-        return
-    resultado = postfija_a_infija(expresion)
-    if resultado:
-        resultado_label.config(text=f"Infija: {resultado}")
+    # Crear ventana principal
+    ventana = tk.Tk()
+    ventana.title("Conversor Infija ↔ Postfija")
+    ventana.geometry("600x500")
 
+    # Entrada de expresión
+    tk.Label(ventana, text="Ingrese expresión:").pack()
+    entrada = tk.Entry(ventana, width=40)
+    entrada.pack()
 
-# Crear ventana principal
-ventana = tk.Tk()
-ventana.title("Conversor Infija ↔ Postfija")
-ventana.geometry("600x500")
+    # Botones de conversión
+    tk.Button(ventana, text="A Postfija", command=convertir_a_postfija).pack()
+    tk.Button(ventana, text="A Infija", command=convertir_a_infija).pack()
+    parentesis_minimos = tk.BooleanVar(value=False)
+    tk.Checkbutton(ventana, text="Solo los paréntesis necesarios",
+                   variable=parentesis_minimos).pack()
 
-# Entrada de expresión
-tk.Label(ventana, text="Ingrese expresión:").pack()
-entrada = tk.Entry(ventana, width=40)
-entrada.pack()
+    # Etiqueta de resultado
+    resultado_label = tk.Label(ventana, text="Resultado: ")
+    resultado_label.pack()
 
-# Botones de conversión
-tk.Button(ventana, text="A Postfija", command=convertir_a_postfija).pack()
-tk.Button(ventana, text="A Infija", command=convertir_a_infija).pack()
+    # Cuadro de texto para mostrar pasos, con su barra de desplazamiento
+    marco = tk.Frame(ventana)
+    marco.pack()
+    barra = tk.Scrollbar(marco, command=desplazar)
+    barra.pack(side=tk.RIGHT, fill=tk.Y)
+    pasos_texto = tk.Text(marco, height=LINEAS_VISIBLES, width=70, wrap="none")
+    pasos_texto.pack(side=tk.LEFT)
+    for evento in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+        pasos_texto.bind(evento, rueda)
 
-# Etiqueta de resultado
-resultado_label = tk.Label(ventana, text="Resultado: ")
-resultado_label.pack()
+    ventana.mainloop()
 
-# Cuadro de texto para mostrar pasos
-pasos_texto = tk.Text(ventana, height=20, width=70)
-pasos_texto.pack()
 
-ventana.mainloop()
+if __name__ == "__main__":
+    main()
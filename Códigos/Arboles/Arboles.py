@@ -1,5 +1,10 @@
-import tkinter as tk
-from tkinter import simpledialog, messagebox
+# Tkinter se importa solo al abrir la interfaz, así ArbolBinario se puede usar sin GUI
+tk = simpledialog = messagebox = None
+
+def _cargar_tkinter():
+    global tk, simpledialog, messagebox
+    import tkinter as tk
+    from tkinter import simpledialog, messagebox
 
 class Nodo:
     def __init__(self, valor):
@@ -64,6 +69,7 @@ class ArbolBinario:
 
 class InterfazGrafica:
     def __init__(self, arbol):
+        _cargar_tkinter()
         self.arbol = arbol
         self.root = tk.Tk()
         self.root.title("Árbol Binario - Recorridos")
@@ -153,6 +159,7 @@ class InterfazGrafica:
 
 # === Programa principal ===
 def main():
+    _cargar_tkinter()
     arbol = ArbolBinario()
     root = tk.Tk()
     root.withdraw()
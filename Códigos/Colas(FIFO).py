@@ -1,74 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-class Cola:
-    """
-    Clase que implementa una estructura de datos Cola (FIFO).
-    
-    Atributos:
-        elementos: Lista que almacena los elementos de la cola.
-    """
-    def __init__(self):
-        """Inicializa una cola vacía."""
-        self.elementos = []
-    
-    def encolar(self, dato):
-        """Agrega un elemento al final de la cola.
-        
-        Args:
-            dato: Elemento a agregar a la cola.
-        """
-        self.elementos.append(dato)
-    
-    def desencolar(self):
-        """Elimina y retorna el primer elemento de la cola.
-        
-        Returns:
-            El elemento removido de la cola.
-            
-        Raises:
-            IndexError: Si la cola está vacía.
-        """
-        if self.esta_vacia():
-            raise IndexError("La cola está vacía")
-        return self.elementos.pop(0)
-    
-    def frente(self):
-        """Retorna el primer elemento de la cola sin eliminarlo.
-        
-        Returns:
-            El elemento al frente de la cola.
-            
-        Raises:
-            IndexError: Si la cola está vacía.
-        """
-        if self.esta_vacia():
-            raise IndexError("La cola está vacía")
-        return self.elementos[0]
-    
-    def esta_vacia(self):
-        """Verifica si la cola está vacía.
-        
-        Returns:
-            bool: True si la cola está vacía, False en caso contrario.
-        """
-        return len(self.elementos) == 0
-    
-    def tamanio(self):
-        """Retorna el número de elementos en la cola.
-        
-        Returns:
-            int: Cantidad de elementos en la cola.
-        """
-        return len(self.elementos)
-    
-    def obtener_elementos(self):
-        """Retorna una lista con todos los elementos de la cola.
-        
-        Returns:
-            list: Elementos de la cola en orden (frente a final).
-        """
-        return self.elementos.copy()
+from cola import Cola
 
 class AplicacionColas:
     """
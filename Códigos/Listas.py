@@ -6,8 +6,60 @@ y visualización en ambos tipos de listas, mostrando los resultados en una inter
 desarrollada con Tkinter.
 """
 
-import tkinter as tk
-from tkinter import ttk, messagebox
+from array import array
+from collections import deque
+from itertools import islice
+
+# Tkinter se importa solo al abrir la interfaz (ver _cargar_tkinter), así las
+# listas se pueden importar desde programas sin interfaz gráfica
+tk = ttk = messagebox = None
+
+def _cargar_tkinter():
+    """Importa Tkinter en las variables globales del módulo la primera vez que se necesita."""
+    global tk, ttk, messagebox
+    import tkinter as tk
+    from tkinter import ttk, messagebox
+
+def _dato_en(lista, indice, desde_la_cola):
+    """Busca el dato de una posición recorriendo la lista.
+    
+    Args:
+        lista: Lista enlazada con __iter__, __reversed__ y __len__.
+        indice: Posición entera; las negativas cuentan desde el final.
+        desde_la_cola: Si es True, las posiciones de la segunda mitad se
+            buscan recorriendo desde la cola.
+        
+    Returns:
+        El dato de esa posición.
+        
+    Raises:
+        IndexError: Si la posición no existe.
+    """
+    tamano = len(lista)
+    if indice < 0:
+        indice += tamano
+    if not 0 <= indice < tamano:
+        raise IndexError("Índice fuera de rango")
+    if desde_la_cola and indice >= tamano // 2:
+        return next(islice(reversed(lista), tamano - 1 - indice, None))
+    return next(islice(lista, indice, None))
+
+def _datos_en_corte(lista, corte):
+    """Recorre los datos que selecciona un corte (slice), en el orden del corte.
+    
+    Args:
+        lista: Lista enlazada con __iter__, __reversed__ y __len__.
+        corte: slice con inicio, fin y paso, como en las listas de Python.
+        
+    Returns:
+        iterator: Los datos seleccionados, sin copiar la lista.
+    """
+    tamano = len(lista)
+    inicio, fin, paso = corte.indices(tamano)
+    if paso > 0:
+        return islice(lista, inicio, max(inicio, fin), paso)
+    # Con paso negativo se recorre desde la cola: la posición i es la tamano-1-i al revés
+    return islice(reversed(lista), tamano - 1 - inicio, max(tamano - 1 - inicio, tamano - 1 - fin), -paso)
 
 class NodoSimple:
     """
@@ -17,6 +69,8 @@ class NodoSimple:
         dato: Valor almacenado en el nodo.
         siguiente: Referencia al siguiente nodo en la lista.
     """
+    __slots__ = ('dato', 'siguiente')  # Sin __dict__ por nodo: cada uno ocupa menos memoria
+    
     def __init__(self, dato):
         """Inicializa un nodo con el dato proporcionado."""
         self.dato = dato
@@ -28,10 +82,14 @@ class ListaSimple:
     
     Atributos:
         cabeza: Referencia al primer nodo de la lista.
+        cola: Referencia al último nodo de la lista.
+        tamano: Cantidad de nodos en la lista.
     """
     def __init__(self):
         """Inicializa una lista vacía."""
         self.cabeza = None  # La lista comienza vacía
+        self.cola = None  # Último nodo: insertar al final no recorre la lista
+        self.tamano = 0
     
     def esta_vacia(self):
         """Verifica si la lista está vacía.
@@ -50,6 +108,9 @@ class ListaSimple:
         nuevo = NodoSimple(dato)  # Crear nuevo nodo
         nuevo.siguiente = self.cabeza  # El nuevo nodo apunta a la antigua cabeza
         self.cabeza = nuevo  # El nuevo nodo se convierte en la cabeza
+        if self.cola is None:
+            self.cola = nuevo  # Era la lista vacía: el nuevo nodo también es el último
+        self.tamano += 1
     
     def insertar_final(self, dato):
         """Inserta un nuevo nodo al final de la lista.
@@ -61,11 +122,9 @@ class ListaSimple:
         if self.esta_vacia():
             self.cabeza = nuevo  # Si está vacía, el nuevo nodo es la cabeza
         else:
-            actual = self.cabeza
-            # Recorrer hasta encontrar el último nodo
-            while actual.siguiente is not None:
-                actual = actual.siguiente
-            actual.siguiente = nuevo  # El último nodo apunta al nuevo
+            self.cola.siguiente = nuevo  # El último nodo apunta al nuevo
+        self.cola = nuevo  # El nuevo nodo se convierte en la cola
+        self.tamano += 1
     
     def eliminar(self, dato):
         """Elimina la primera ocurrencia del dato en la lista.
@@ -82,6 +141,9 @@ class ListaSimple:
         # Caso especial: eliminar el primer nodo
         if self.cabeza.dato == dato:
             self.cabeza = self.cabeza.siguiente
+            if self.cabeza is None:
+                self.cola = None  # Era el único nodo
+            self.tamano -= 1
             return True
         
         anterior = self.cabeza
@@ -90,24 +152,107 @@ class ListaSimple:
         while actual is not None:
             if actual.dato == dato:
                 anterior.siguiente = actual.siguiente  # Saltar el nodo a eliminar
+                if actual is self.cola:
+                    self.cola = anterior  # Se eliminó el último nodo
+                self.tamano -= 1
                 return True
             anterior = actual
             actual = actual.siguiente
         
         return False  # Dato no encontrado
     
-    def obtener_lista(self):
-        """Obtiene todos los elementos de la lista en orden.
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Construye una lista con los elementos del iterable, en orden.
         
+        Args:
+            iterable: Cualquier iterable de datos.
+            
         Returns:
-            list: Lista con los elementos en orden de la lista enlazada.
+            ListaSimple: La lista nueva.
+        """
+        lista = cls()
+        lista.extend(iterable)
+        return lista
+    
+    def extend(self, iterable):
+        """Agrega al final todos los elementos del iterable, enlazándolos en una pasada.
+        
+        Args:
+            iterable: Cualquier iterable de datos.
+        """
+        anterior = self.cola
+        cantidad = 0
+        for dato in iterable:
+            nuevo = NodoSimple(dato)
+            if anterior is None:
+                self.cabeza = nuevo
+            else:
+                anterior.siguiente = nuevo
+            anterior = nuevo
+            cantidad += 1
+        self.cola = anterior
+        self.tamano += cantidad
+    
+    def __iter__(self):
+        """Recorre los datos de la cabeza a la cola sin copiarlos."""
+        actual = self.cabeza
+        while actual is not None:
+            yield actual.dato
+            actual = actual.siguiente
+    
+    def __reversed__(self):
+        """Recorre los datos de la cola a la cabeza.
+        
+        Los nodos solo apuntan al siguiente, así que primero se guardan las
+        referencias a los nodos (no los datos convertidos) en una lista.
         """
-        elementos = []
+        nodos = []
         actual = self.cabeza
         while actual is not None:
-            elementos.append(str(actual.dato))
+            nodos.append(actual)
             actual = actual.siguiente
-        return elementos
+        for nodo in reversed(nodos):
+            yield nodo.dato
+    
+    def __len__(self):
+        """Retorna la cantidad de nodos en O(1), sin recorrer la lista."""
+        return self.tamano
+    
+    def __contains__(self, dato):
+        """Verifica si el dato está en la lista, recorriéndola desde la cabeza.
+        
+        Args:
+            dato: Valor a buscar.
+            
+        Returns:
+            bool: True si algún nodo tiene un dato igual, False en caso contrario.
+        """
+        return any(elemento == dato for elemento in self)
+    
+    def __getitem__(self, indice):
+        """Obtiene un dato por posición, o una lista nueva con un corte.
+        
+        Args:
+            indice: Entero (negativo cuenta desde el final) o slice.
+            
+        Returns:
+            El dato de esa posición, o una ListaSimple con los datos del corte.
+            
+        Raises:
+            IndexError: Si la posición no existe.
+        """
+        if isinstance(indice, slice):
+            return self.from_iterable(_datos_en_corte(self, indice))
+        return _dato_en(self, indice, desde_la_cola=False)
+    
+    def obtener_lista(self):
+        """Obtiene todos los elementos de la lista en orden.
+        
+        Returns:
+            list: Lista con los elementos en orden de la lista enlazada.
+        """
+        return [str(dato) for dato in self]
 
 class NodoDoble:
     """
@@ -118,6 +263,8 @@ class NodoDoble:
         siguiente: Referencia al siguiente nodo en la lista.
         anterior: Referencia al nodo anterior en la lista.
     """
+    __slots__ = ('dato', 'siguiente', 'anterior')
+    
     def __init__(self, dato):
         """Inicializa un nodo con el dato proporcionado."""
         self.dato = dato
@@ -131,11 +278,21 @@ class ListaDoble:
     Atributos:
         cabeza: Referencia al primer nodo de la lista.
         cola: Referencia al último nodo de la lista.
+        indice: Diccionario dato -> deque de sus nodos en el orden de la lista,
+            o None si la lista no está indexada.
+        tamano: Cantidad de nodos en la lista.
     """
-    def __init__(self):
-        """Inicializa una lista vacía."""
+    def __init__(self, indexada=False):
+        """Inicializa una lista vacía.
+        
+        Args:
+            indexada: Si es True, se mantiene un índice por valor y eliminar()
+                no recorre la lista. Los datos deben ser hashables.
+        """
         self.cabeza = None
         self.cola = None
+        self.indice = {} if indexada else None
+        self.tamano = 0
     
     def esta_vacia(self):
         """Verifica si la lista está vacía.
@@ -150,7 +307,16 @@ class ListaDoble:
         
         Args:
             dato: Valor a insertar en la lista.
+            
+        Returns:
+            NodoDoble: El nodo creado, para poder moverlo o quitarlo después en O(1).
+            
+        Raises:
+            TypeError: Si la lista está indexada y el dato no es hashable; la
+                lista queda como estaba.
         """
+        # El índice se consulta antes de enlazar: un dato no hashable falla sin tocar la lista
+        nodos = self.indice.setdefault(dato, deque()) if self.indice is not None else None
         nuevo = NodoDoble(dato)
         if self.esta_vacia():
             self.cabeza = self.cola = nuevo  # Lista vacía, cabeza y cola son el nuevo nodo
@@ -158,13 +324,26 @@ class ListaDoble:
             nuevo.siguiente = self.cabeza
             self.cabeza.anterior = nuevo
             self.cabeza = nuevo  # El nuevo nodo se convierte en la cabeza
+        if nodos is not None:
+            # Es el primero de la lista, así que también es la primera ocurrencia
+            nodos.appendleft(nuevo)
+        self.tamano += 1
+        return nuevo
     
     def insertar_final(self, dato):
         """Inserta un nuevo nodo al final de la lista.
         
         Args:
             dato: Valor a insertar en la lista.
+            
+        Returns:
+            NodoDoble: El nodo creado, para poder moverlo o quitarlo después en O(1).
+            
+        Raises:
+            TypeError: Si la lista está indexada y el dato no es hashable; la
+                lista queda como estaba.
         """
+        nodos = self.indice.setdefault(dato, deque()) if self.indice is not None else None
         nuevo = NodoDoble(dato)
         if self.esta_vacia():
             self.cabeza = self.cola = nuevo
@@ -172,6 +351,10 @@ class ListaDoble:
             nuevo.anterior = self.cola
             self.cola.siguiente = nuevo
             self.cola = nuevo  # El nuevo nodo se convierte en la cola
+        if nodos is not None:
+            nodos.append(nuevo)
+        self.tamano += 1
+        return nuevo
     
     def eliminar(self, dato):
         """Elimina la primera ocurrencia del dato en la lista.
@@ -185,45 +368,177 @@ class ListaDoble:
         if self.esta_vacia():
             return False  # Lista vacía
         
-        # Caso 1: Eliminar el primer nodo
-        if self.cabeza.dato == dato:
-            if self.cabeza == self.cola:  # Solo hay un nodo
-                self.cabeza = self.cola = None
-            else:
-                self.cabeza = self.cabeza.siguiente
-                self.cabeza.anterior = None
+        if self.indice is not None:
+            # Con índice: la primera ocurrencia es la primera de su deque
+            nodos = self.indice.get(dato)
+            if not nodos:
+                return False
+            self.eliminar_nodo(nodos[0])
             return True
         
-        # Caso 2: Eliminar el último nodo
-        if self.cola.dato == dato:
-            self.cola = self.cola.anterior
-            self.cola.siguiente = None
-            return True
-        
-        # Caso 3: Eliminar un nodo intermedio
-        actual = self.cabeza.siguiente
+        # Sin índice: buscar el nodo desde la cabeza
+        actual = self.cabeza
         while actual is not None:
             if actual.dato == dato:
-                actual.anterior.siguiente = actual.siguiente
-                if actual.siguiente is not None:
-                    actual.siguiente.anterior = actual.anterior
+                self.eliminar_nodo(actual)
                 return True
             actual = actual.siguiente
         
         return False  # Dato no encontrado
     
-    def obtener_lista_adelante(self):
-        """Obtiene todos los elementos de la lista en orden de inicio a fin.
+    def eliminar_nodo(self, nodo):
+        """Quita un nodo de la lista (y del índice) en O(1), sin recorrerla.
         
+        Args:
+            nodo: NodoDoble que pertenece a esta lista.
+        """
+        # Caso 1: el nodo es la cabeza
+        if nodo.anterior is None:
+            self.cabeza = nodo.siguiente
+        else:
+            nodo.anterior.siguiente = nodo.siguiente
+        # Caso 2: el nodo es la cola
+        if nodo.siguiente is None:
+            self.cola = nodo.anterior
+        else:
+            nodo.siguiente.anterior = nodo.anterior
+        nodo.anterior = nodo.siguiente = None
+        self.tamano -= 1
+        
+        if self.indice is not None:
+            nodos = self.indice[nodo.dato]
+            if nodos[0] is nodo:
+                nodos.popleft()  # El caso común: se quita la primera ocurrencia
+            elif nodos[-1] is nodo:
+                nodos.pop()
+            else:
+                nodos.remove(nodo)
+            if not nodos:
+                del self.indice[nodo.dato]
+    
+    def mover_al_inicio(self, nodo):
+        """Lleva un nodo de la lista a la cabeza en O(1), sin crear uno nuevo.
+        
+        Args:
+            nodo: NodoDoble que pertenece a esta lista.
+        """
+        if nodo is self.cabeza:
+            return
+        self.eliminar_nodo(nodo)
+        nodo.siguiente = self.cabeza
+        if self.cabeza is None:
+            self.cola = nodo
+        else:
+            self.cabeza.anterior = nodo
+        self.cabeza = nodo
+        self.tamano += 1  # eliminar_nodo lo había descontado
+        if self.indice is not None:
+            self.indice.setdefault(nodo.dato, deque()).appendleft(nodo)
+    
+    @classmethod
+    def from_iterable(cls, iterable, indexada=False):
+        """Construye una lista con los elementos del iterable, en orden.
+        
+        Args:
+            iterable: Cualquier iterable de datos.
+            indexada: Igual que en el constructor.
+            
         Returns:
-            list: Lista con los elementos en orden de inicio a fin.
+            ListaDoble: La lista nueva.
         """
-        elementos = []
+        lista = cls(indexada)
+        lista.extend(iterable)
+        return lista
+    
+    def extend(self, iterable):
+        """Agrega al final todos los elementos del iterable, enlazándolos en una pasada.
+        
+        Args:
+            iterable: Cualquier iterable de datos.
+            
+        Raises:
+            TypeError: Si la lista está indexada y un dato no es hashable; los
+                datos anteriores a ese quedan agregados.
+        """
+        anterior = self.cola
+        indice = self.indice
+        cantidad = 0
+        try:
+            for dato in iterable:
+                nodos = indice.setdefault(dato, deque()) if indice is not None else None
+                nuevo = NodoDoble(dato)
+                if anterior is None:
+                    self.cabeza = nuevo
+                else:
+                    nuevo.anterior = anterior
+                    anterior.siguiente = nuevo
+                if nodos is not None:
+                    nodos.append(nuevo)
+                anterior = nuevo
+                cantidad += 1
+        finally:
+            # También si el iterable o un dato fallan: la cola y el tamaño cubren lo enlazado
+            self.cola = anterior
+            self.tamano += cantidad
+    
+    def __iter__(self):
+        """Recorre los datos de la cabeza a la cola sin copiarlos."""
         actual = self.cabeza
         while actual is not None:
-            elementos.append(str(actual.dato))
+            yield actual.dato
             actual = actual.siguiente
-        return elementos
+    
+    def __reversed__(self):
+        """Recorre los datos de la cola a la cabeza sin copiarlos."""
+        actual = self.cola
+        while actual is not None:
+            yield actual.dato
+            actual = actual.anterior
+    
+    def __len__(self):
+        """Retorna la cantidad de nodos en O(1), sin recorrer la lista."""
+        return self.tamano
+    
+    def __contains__(self, dato):
+        """Verifica si el dato está en la lista.
+        
+        Args:
+            dato: Valor a buscar.
+            
+        Returns:
+            bool: True si algún nodo tiene un dato igual. Con índice se responde
+                en O(1); sin él se recorre la lista desde la cabeza.
+        """
+        if self.indice is not None:
+            return dato in self.indice  # Con índice no hace falta recorrer
+        return any(elemento == dato for elemento in self)
+    
+    def __getitem__(self, indice):
+        """Obtiene un dato por posición, o una lista nueva con un corte.
+        
+        Las posiciones de la segunda mitad se buscan desde la cola.
+        
+        Args:
+            indice: Entero (negativo cuenta desde el final) o slice.
+            
+        Returns:
+            El dato de esa posición, o una ListaDoble (indexada si esta lo es)
+            con los datos del corte.
+            
+        Raises:
+            IndexError: Si la posición no existe.
+        """
+        if isinstance(indice, slice):
+            return self.from_iterable(_datos_en_corte(self, indice), self.indice is not None)
+        return _dato_en(self, indice, desde_la_cola=True)
+    
+    def obtener_lista_adelante(self):
+        """Obtiene todos los elementos de la lista en orden de inicio a fin.
+        
+        Returns:
+            list: Lista con los elementos en orden de inicio a fin.
+        """
+        return [str(dato) for dato in self]
     
     def obtener_lista_atras(self):
         """Obtiene todos los elementos de la lista en orden de fin a inicio.
@@ -231,12 +546,245 @@ class ListaDoble:
         Returns:
             list: Lista con los elementos en orden de fin a inicio.
         """
-        elementos = []
+        return [str(dato) for dato in reversed(self)]
+
+class ListaDoblePool:
+    """
+    Lista doblemente enlazada sin objetos nodo: los enlaces son índices en
+    arreglos paralelos. Un nodo cuesta una referencia en 'datos' y dos enteros
+    de 4 bytes, en lugar de un objeto de Python por elemento.
+    
+    Los huecos que dejan los nodos eliminados forman una lista libre, enlazada
+    por 'siguientes', y se reutilizan en las inserciones siguientes.
+    
+    Atributos:
+        datos: Lista con el dato de cada posición (None en las libres).
+        siguientes: array('i') con el índice del siguiente nodo, o -1.
+        anteriores: array('i') con el índice del nodo anterior, o -1.
+        cabeza: Índice del primer nodo, o -1 si la lista está vacía.
+        cola: Índice del último nodo, o -1 si la lista está vacía.
+        libre: Índice de la primera posición libre, o -1 si no hay.
+        tamano: Cantidad de nodos en la lista.
+    """
+    NULO = -1
+    
+    def __init__(self):
+        """Inicializa una lista vacía."""
+        self.datos = []
+        self.siguientes = array('i')
+        self.anteriores = array('i')
+        self.cabeza = self.cola = self.libre = self.NULO
+        self.tamano = 0
+    
+    def esta_vacia(self):
+        """Verifica si la lista está vacía.
+        
+        Returns:
+            bool: True si la lista está vacía, False en caso contrario.
+        """
+        return self.cabeza == self.NULO
+    
+    def _nuevo_nodo(self, dato):
+        """Toma una posición de la lista libre, o agrega una al final de los arreglos."""
+        if self.libre != self.NULO:
+            indice = self.libre
+            self.libre = self.siguientes[indice]
+            self.datos[indice] = dato
+        else:
+            indice = len(self.datos)
+            self.datos.append(dato)
+            self.siguientes.append(self.NULO)
+            self.anteriores.append(self.NULO)
+        self.tamano += 1
+        return indice
+    
+    def insertar_inicio(self, dato):
+        """Inserta un nuevo nodo al inicio de la lista.
+        
+        Args:
+            dato: Valor a insertar en la lista.
+            
+        Returns:
+            int: Índice del nodo creado.
+        """
+        nuevo = self._nuevo_nodo(dato)
+        self.anteriores[nuevo] = self.NULO
+        self.siguientes[nuevo] = self.cabeza
+        if self.esta_vacia():
+            self.cola = nuevo
+        else:
+            self.anteriores[self.cabeza] = nuevo
+        self.cabeza = nuevo
+        return nuevo
+    
+    def insertar_final(self, dato):
+        """Inserta un nuevo nodo al final de la lista.
+        
+        Args:
+            dato: Valor a insertar en la lista.
+            
+        Returns:
+            int: Índice del nodo creado.
+        """
+        nuevo = self._nuevo_nodo(dato)
+        self.siguientes[nuevo] = self.NULO
+        self.anteriores[nuevo] = self.cola
+        if self.esta_vacia():
+            self.cabeza = nuevo
+        else:
+            self.siguientes[self.cola] = nuevo
+        self.cola = nuevo
+        return nuevo
+    
+    def eliminar(self, dato):
+        """Elimina la primera ocurrencia del dato en la lista.
+        
+        Args:
+            dato: Valor a eliminar de la lista.
+            
+        Returns:
+            bool: True si se eliminó el dato, False si no se encontró.
+        """
+        datos, siguientes = self.datos, self.siguientes
+        actual = self.cabeza
+        while actual != self.NULO:
+            if datos[actual] == dato:
+                self.eliminar_nodo(actual)
+                return True
+            actual = siguientes[actual]
+        return False  # Dato no encontrado
+    
+    def eliminar_nodo(self, indice):
+        """Quita el nodo de la posición dada en O(1) y la devuelve a la lista libre.
+        
+        Args:
+            indice: Índice de un nodo de esta lista.
+        """
+        anterior, siguiente = self.anteriores[indice], self.siguientes[indice]
+        if anterior == self.NULO:
+            self.cabeza = siguiente
+        else:
+            self.siguientes[anterior] = siguiente
+        if siguiente == self.NULO:
+            self.cola = anterior
+        else:
+            self.anteriores[siguiente] = anterior
+        self.datos[indice] = None  # No retener el dato eliminado
+        self.siguientes[indice] = self.libre
+        self.libre = indice
+        self.tamano -= 1
+    
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Construye una lista con los elementos del iterable, en orden.
+        
+        Args:
+            iterable: Cualquier iterable de datos.
+            
+        Returns:
+            ListaDoblePool: La lista nueva.
+        """
+        lista = cls()
+        lista.extend(iterable)
+        return lista
+    
+    def extend(self, iterable):
+        """Agrega al final todos los elementos del iterable, enlazándolos en una pasada.
+        
+        Primero se ocupan las posiciones libres; el resto de los datos se agrega
+        de una vez al final de los arreglos, con enlaces consecutivos.
+        
+        Args:
+            iterable: Cualquier iterable de datos.
+        """
+        datos = iter(iterable)
+        while self.libre != self.NULO:
+            dato = next(datos, self)  # La lista misma marca el fin: nunca es un dato del iterable
+            if dato is self:
+                return
+            self.insertar_final(dato)
+        
+        inicio = len(self.datos)
+        self.datos.extend(datos)
+        cantidad = len(self.datos) - inicio
+        if cantidad == 0:
+            return
+        # El nodo i apunta a i + 1 y a i - 1; luego se corrigen los extremos
+        self.siguientes.extend(range(inicio + 1, inicio + cantidad + 1))
+        self.anteriores.extend(range(inicio - 1, inicio + cantidad - 1))
+        self.siguientes[-1] = self.NULO
+        self.anteriores[inicio] = self.cola
+        if self.esta_vacia():
+            self.cabeza = inicio
+        else:
+            self.siguientes[self.cola] = inicio
+        self.cola = inicio + cantidad - 1
+        self.tamano += cantidad
+    
+    def __iter__(self):
+        """Recorre los datos de la cabeza a la cola sin copiarlos."""
+        datos, siguientes = self.datos, self.siguientes
+        actual = self.cabeza
+        while actual != self.NULO:
+            yield datos[actual]
+            actual = siguientes[actual]
+    
+    def __reversed__(self):
+        """Recorre los datos de la cola a la cabeza sin copiarlos."""
+        datos, anteriores = self.datos, self.anteriores
         actual = self.cola
-        while actual is not None:
-            elementos.append(str(actual.dato))
-            actual = actual.anterior
-        return elementos
+        while actual != self.NULO:
+            yield datos[actual]
+            actual = anteriores[actual]
+    
+    def __len__(self):
+        """Retorna la cantidad de nodos en O(1), sin recorrer la lista."""
+        return self.tamano
+    
+    def __contains__(self, dato):
+        """Verifica si el dato está en la lista, recorriéndola desde la cabeza.
+        
+        Args:
+            dato: Valor a buscar.
+            
+        Returns:
+            bool: True si algún nodo tiene un dato igual, False en caso contrario.
+        """
+        return any(elemento == dato for elemento in self)
+    
+    def __getitem__(self, indice):
+        """Obtiene un dato por posición, o una lista nueva con un corte.
+        
+        Las posiciones de la segunda mitad se buscan desde la cola.
+        
+        Args:
+            indice: Entero (negativo cuenta desde el final) o slice.
+            
+        Returns:
+            El dato de esa posición, o una ListaDoblePool con los datos del corte.
+            
+        Raises:
+            IndexError: Si la posición no existe.
+        """
+        if isinstance(indice, slice):
+            return self.from_iterable(_datos_en_corte(self, indice))
+        return _dato_en(self, indice, desde_la_cola=True)
+    
+    def obtener_lista_adelante(self):
+        """Obtiene todos los elementos de la lista en orden de inicio a fin.
+        
+        Returns:
+            list: Lista con los elementos en orden de inicio a fin.
+        """
+        return [str(dato) for dato in self]
+    
+    def obtener_lista_atras(self):
+        """Obtiene todos los elementos de la lista en orden de fin a inicio.
+        
+        Returns:
+            list: Lista con los elementos en orden de fin a inicio.
+        """
+        return [str(dato) for dato in reversed(self)]
 
 class AplicacionListas:
     """
@@ -249,6 +797,7 @@ class AplicacionListas:
     """
     def __init__(self, root):
         """Inicializa la aplicación con la ventana principal."""
+        _cargar_tkinter()
         self.root = root
         self.root.title("Listas Encadenadas - Documentado")
         self.root.geometry("600x400")
@@ -467,8 +1016,7 @@ class AplicacionListas:
     def _actualizar_listbox_simple(self):
         """Actualiza el ListBox de la lista simple con los datos actuales."""
         self.listbox_simple.delete(0, tk.END)
-        elementos = self.lista_simple.obtener_lista()
-        for elemento in elementos:
+        for elemento in self.lista_simple:
             self.listbox_simple.insert(tk.END, elemento)
     
     def _actualizar_listbox_doble(self):
@@ -476,17 +1024,15 @@ class AplicacionListas:
         self.listbox_doble_adelante.delete(0, tk.END)
         self.listbox_doble_atras.delete(0, tk.END)
         
-        elementos_adelante = self.lista_doble.obtener_lista_adelante()
-        elementos_atras = self.lista_doble.obtener_lista_atras()
-        
-        for elemento in elementos_adelante:
+        for elemento in self.lista_doble:
             self.listbox_doble_adelante.insert(tk.END, elemento)
         
-        for elemento in elementos_atras:
+        for elemento in reversed(self.lista_doble):
             self.listbox_doble_atras.insert(tk.END, elemento)
 
 if __name__ == "__main__":
     # Punto de entrada principal de la aplicación
+    _cargar_tkinter()
     root = tk.Tk()
     app = AplicacionListas(root)
     root.mainloop()
\ No newline at end of file
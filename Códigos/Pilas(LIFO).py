@@ -1,74 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-class Pila:
-    """
-    Clase que implementa una estructura de datos Pila (LIFO).
-    
-    Atributos:
-        elementos: Lista que almacena los elementos de la pila.
-    """
-    def __init__(self):
-        """Inicializa una pila vacía."""
-        self.elementos = []
-    
-    def apilar(self, dato):
-        """Agrega un elemento a la parte superior de la pila.
-        
-        Args:
-            dato: Elemento a agregar a la pila.
-        """
-        self.elementos.append(dato)
-    
-    def desapilar(self):
-        """Elimina y retorna el elemento superior de la pila.
-        
-        Returns:
-            El elemento removido de la pila.
-            
-        Raises:
-            IndexError: Si la pila está vacía.
-        """
-        if self.esta_vacia():
-            raise IndexError("La pila está vacía")
-        return self.elementos.pop()
-    
-    def cima(self):
-        """Retorna el elemento superior de la pila sin eliminarlo.
-        
-        Returns:
-            El elemento en la cima de la pila.
-            
-        Raises:
-            IndexError: Si la pila está vacía.
-        """
-        if self.esta_vacia():
-            raise IndexError("La pila está vacía")
-        return self.elementos[-1]
-    
-    def esta_vacia(self):
-        """Verifica si la pila está vacía.
-        
-        Returns:
-            bool: True si la pila está vacía, False en caso contrario.
-        """
-        return len(self.elementos) == 0
-    
-    def tamanio(self):
-        """Retorna el número de elementos en la pila.
-        
-        Returns:
-            int: Cantidad de elementos en la pila.
-        """
-        return len(self.elementos)
-    
-    def obtener_elementos(self):
-        """Retorna una lista con todos los elementos de la pila.
-        
-        Returns:
-            list: Elementos de la pila en orden (base a cima).
-        """
-        return self.elementos.copy()
+from pila import Pila
 
 class AplicacionPilas:
     """
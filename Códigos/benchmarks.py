@@ -0,0 +1,352 @@
+import argparse
+import os
+import random
+import subprocess
+import sys
+import time
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+def medir(funcion, repeticiones):
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return time.perf_counter() - inicio
+
+def reportar(nombre, segundos, operaciones):
+    print(f"{nombre:<28} {segundos:8.3f} s   {operaciones / segundos:14,.0f} ops/s")
+
+# === Importación de las estructuras sin Tkinter (python -X importtime) ===
+MODULOS_NUCLEO = ["App", "evaluador", "conversor", "Listas", "cache", "pila", "cola", "Arboles"]
+
+def tiempos_de_importacion(modulos):
+    # Devuelve {módulo: (microsegundos acumulados, anidado)} de un intérprete nuevo
+    codigo = "import " + ", ".join(modulos)
+    entorno = dict(os.environ, PYTHONPATH=os.path.join(DIRECTORIO, "Arboles"))
+    salida = subprocess.run([sys.executable, "-X", "importtime", "-c", codigo], cwd=DIRECTORIO,
+                            env=entorno, capture_output=True, text=True, check=True)
+    tiempos = {}
+    for linea in salida.stderr.splitlines():
+        if not linea.startswith("import time:") or linea.endswith("imported package"):
+            continue
+        _, acumulado, nombre = linea[len("import time:"):].split("|")
+        tiempos[nombre.strip()] = (int(acumulado), nombre.startswith("  "))
+    return tiempos
+
+def bench_importacion(args):
+    tiempos_de_importacion(MODULOS_NUCLEO)  # El primer intento genera los .pyc
+    tiempos = tiempos_de_importacion(MODULOS_NUCLEO)
+    total = sum(microsegundos for nombre, (microsegundos, anidado) in tiempos.items()
+                if nombre in MODULOS_NUCLEO and not anidado)
+    for modulo in MODULOS_NUCLEO:
+        print(f"{modulo:<28} {tiempos[modulo][0] / 1000:8.2f} ms")
+    print(f"{'total':<28} {total / 1000:8.2f} ms (presupuesto {args.presupuesto} ms)")
+
+    errores = [f"se importó {nombre}" for nombre in tiempos if nombre.split(".")[0] in ("tkinter", "_tkinter")]
+    if total / 1000 > args.presupuesto:
+        errores.append("se superó el presupuesto de tiempo")
+    for error in errores:
+        print(f"Error: {error}")
+    if errores:
+        sys.exit(1)
+
+# === Conversión infija -> postfija con tokens de varios caracteres ===
+def generar_infija(tokens):
+    # Repite un patrón con números, identificadores, paréntesis y '^' anidado
+    patron = ["x1", "+", "23", "*", "(", "y2", "-", "4.5", ")", "^", "2", "^", "n", "/", "77", "-"]
+    repeticiones = max(1, tokens // len(patron))
+    return " ".join(patron * repeticiones) + " 1"
+
+def bench_conversion(args):
+    import App
+
+    for tokens in (args.tokens // 10, args.tokens):
+        expresion = generar_infija(tokens)
+        cantidad = len(App.tokenizar(expresion))
+        segundos = medir(lambda: App.infija_a_postfija(expresion), args.repeticiones)
+        reportar(f"sin pasos ({cantidad:,} tokens)", segundos, cantidad * args.repeticiones)
+        segundos = medir(lambda: App.convertir_infija_a_postfija(App.tokenizar(expresion), True),
+                         args.repeticiones)
+        reportar(f"con pasos ({cantidad:,} tokens)", segundos, cantidad * args.repeticiones)
+
+# === Bitácora de pasos virtualizada (lo que hace la interfaz, sin Tkinter) ===
+def bench_bitacora(args):
+    import App
+
+    expresion = generar_infija(args.tokens)
+    inicio = time.perf_counter()
+    salida, pasos = App.convertir_infija_a_postfija(App.tokenizar(expresion), registrar_pasos=True)
+    bitacora = App.Bitacora()
+    bitacora.agregar_pasos(pasos, salida)
+    print(f"{'conversión + bitácora':<28} {time.perf_counter() - inicio:8.3f} s   "
+          f"{bitacora.total_lineas:,} líneas")
+
+    # Ventanas repartidas por toda la bitácora, como al arrastrar la barra
+    posiciones = [bitacora.total_lineas * i // args.ventanas for i in range(args.ventanas)]
+    segundos = medir(lambda: [bitacora.lineas(p, App.LINEAS_VISIBLES, App.TOKENS_POR_LINEA)
+                              for p in posiciones], 1)
+    print(f"{'ventana visible':<28} {segundos / args.ventanas * 1000:8.3f} ms por repintado "
+          f"(presupuesto {1000 / App.REPINTADOS_POR_SEGUNDO:.1f} ms)")
+
+# === Evaluador de postfija compilado a bytecode ===
+def bench_evaluador(args):
+    import App
+    import evaluador
+
+    infija = "(x1 + 23) * (y2 - 4.5) / (n + 1) - x1 ^ 2 + y2 * n - 7 / (x1 - y2 + 100)"
+    asignaciones = [{"x1": i % 17, "y2": i % 5 + 0.5, "n": i % 11} for i in range(args.asignaciones)]
+    en_python = infija.replace("^", "**")
+
+    def convertir_y_eval():
+        # Lo que haría quien solo tiene infija_a_postfija: convertir y evaluar el texto cada vez
+        resultados = []
+        for variables in asignaciones:
+            App.infija_a_postfija(infija)
+            resultados.append(eval(en_python, {}, variables))
+        return resultados
+
+    programa = evaluador.compilar_infija(infija)
+    esperado = convertir_y_eval()
+    if programa.evaluar_muchos(asignaciones) != esperado:
+        sys.exit("Error: el evaluador no coincide con eval")
+
+    reportar("infija_a_postfija + eval", medir(convertir_y_eval, args.repeticiones),
+             len(asignaciones) * args.repeticiones)
+    reportar("bytecode (compilado 1 vez)",
+             medir(lambda: evaluador.compilar_infija(infija).evaluar_muchos(asignaciones), args.repeticiones),
+             len(asignaciones) * args.repeticiones)
+
+# === Postfija a infija: árbol con paréntesis mínimos frente a la versión paso a paso ===
+def bench_infija(args):
+    import App
+
+    for tokens in (args.tokens // 10, args.tokens):
+        postfija = App.infija_a_postfija(generar_infija(tokens))
+        cantidad = len(postfija.split())
+        for nombre, parentesis_minimos in (("mínimos", True), ("todos", False)):
+            segundos = medir(lambda: App.postfija_a_infija(postfija, parentesis_minimos=parentesis_minimos), 1)
+            reportar(f"{nombre} ({cantidad:,})", segundos, cantidad)
+
+    # Paso a paso como en la interfaz: los pasos se registran en la bitácora y
+    # solo se formatean las ventanas visibles
+    postfija = App.infija_a_postfija(generar_infija(args.tokens // 10))
+    tokens = App.tokenizar(postfija)
+    inicio = time.perf_counter()
+    arbol, pasos = App.convertir_postfija_a_infija(tokens, registrar_pasos=True)
+    bitacora = App.Bitacora()
+    bitacora.agregar_pasos(pasos, None, App.formatear_paso_infija, lineas_por_paso=3)
+    App.arbol_a_infija(arbol, False)
+    reportar(f"paso a paso ({len(tokens):,})", time.perf_counter() - inicio, len(tokens))
+    posiciones = [bitacora.total_lineas * i // 1000 for i in range(1000)]
+    segundos = medir(lambda: [bitacora.lineas(p, App.LINEAS_VISIBLES, App.TOKENS_POR_LINEA)
+                              for p in posiciones], 1)
+    print(f"{'ventana visible':<28} {segundos:8.3f} ms por repintado "
+          f"(presupuesto {1000 / App.REPINTADOS_POR_SEGUNDO:.1f} ms)")
+
+# === Conversiones entre infija, postfija y prefija ===
+def bench_notaciones(args):
+    import App
+    import conversor
+
+    infija = generar_infija(args.tokens)
+    formas = {notacion: App.convertir(infija, "infija", notacion) for notacion in App.notaciones}
+    for origen in App.notaciones:
+        for destino in App.notaciones:
+            if origen != destino:
+                cantidad = len(App.tokenizar(formas[origen]))
+                segundos = medir(lambda: App.convertir(formas[origen], origen, destino), 1)
+                reportar(f"{origen} -> {destino}", segundos, cantidad)
+
+    # La herramienta de línea de comandos: muchas expresiones cortas, una por línea
+    lineas = [generar_infija(30)] * args.lineas
+    segundos = medir(lambda: sum(1 for _ in conversor.convertir_lineas(lineas, "infija", "prefija")), 1)
+    reportar("conversor.py (líneas)", segundos, args.lineas)
+
+# === Listas enlazadas: inserción al final con puntero a la cola ===
+def bench_listas(args):
+    import Listas
+
+    # Con la cola, cada inserción cuesta lo mismo: el tiempo por elemento no
+    # crece con el tamaño (recorriendo desde la cabeza crecería linealmente)
+    for cantidad in (args.elementos // 100, args.elementos // 10, args.elementos):
+        lista = Listas.ListaSimple()
+        segundos = medir(lambda: [lista.insertar_final(i) for i in range(cantidad)], 1)
+        print(f"{f'insertar_final ({cantidad:,})':<28} {segundos:8.3f} s   "
+              f"{segundos / cantidad * 1e9:8.1f} ns por elemento   tamaño {lista.tamano:,}")
+
+    # Borrado por valor en ListaDoble: recorrido desde la cabeza contra el índice
+    cantidad = args.elementos // 10
+    valores = random.Random(1).sample(range(cantidad), args.eliminaciones)
+    for indexada in (False, True):
+        lista = Listas.ListaDoble(indexada=indexada)
+        for i in range(cantidad):
+            lista.insertar_final(i)
+        segundos = medir(lambda: [lista.eliminar(v) for v in valores], 1)
+        reportar(f"eliminar ({'con' if indexada else 'sin'} índice)", segundos, len(valores))
+
+    # Construcción en bloque y recorrido perezoso contra las copias en texto
+    datos = range(args.elementos)
+    for clase in (Listas.ListaSimple, Listas.ListaDoble, Listas.ListaDoblePool):
+        nombre = clase.__name__
+        del lista  # Liberar la lista anterior fuera de la medición
+        inicio = time.perf_counter()
+        lista = clase.from_iterable(datos)
+        reportar(f"{nombre}.from_iterable", time.perf_counter() - inicio, len(datos))
+        copiar = lista.obtener_lista if clase is Listas.ListaSimple else lista.obtener_lista_adelante
+        reportar(f"{nombre} obtener_lista", medir(copiar, 1), len(datos))
+        reportar(f"{nombre} for dato in lista", medir(lambda: sum(1 for _ in lista), 1), len(datos))
+
+# === Memoria por elemento: nodos con __dict__, con __slots__ y arreglos ===
+class NodoConDict:
+    # Como NodoDoble antes de __slots__: cada instancia tiene su __dict__
+    def __init__(self, dato):
+        self.dato = dato
+        self.siguiente = None
+        self.anterior = None
+
+def recorrer_nodos(lista):
+    actual = lista.cabeza
+    while actual is not None:
+        actual = actual.siguiente
+
+def recorrer_pool(lista):
+    siguientes = lista.siguientes
+    actual = lista.cabeza
+    while actual != -1:
+        actual = siguientes[actual]
+
+def bench_memoria(args):
+    import tracemalloc
+
+    import Listas
+
+    def con_dict(datos):
+        # ListaDoble enlazando a mano nodos con __dict__
+        lista = Listas.ListaDoble()
+        for dato in datos:
+            nuevo = NodoConDict(dato)
+            if lista.cola is None:
+                lista.cabeza = nuevo
+            else:
+                nuevo.anterior = lista.cola
+                lista.cola.siguiente = nuevo
+            lista.cola = nuevo
+        return lista
+
+    def con_metodo(clase):
+        def construir(datos):
+            lista = clase()
+            for dato in datos:
+                lista.insertar_final(dato)
+            return lista
+        return construir
+
+    datos = list(range(args.elementos))  # Los datos ya existen: solo se mide la estructura
+    variantes = (
+        ("NodoDoble con __dict__", con_dict, recorrer_nodos),
+        ("NodoDoble con __slots__", con_metodo(Listas.ListaDoble), recorrer_nodos),
+        ("ListaDoblePool", con_metodo(Listas.ListaDoblePool), recorrer_pool),
+    )
+    for nombre, construir, recorrer in variantes:
+        tracemalloc.start()
+        lista = construir(datos)
+        memoria, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        segundos = medir(lambda: recorrer(lista), args.repeticiones) / args.repeticiones
+        print(f"{nombre:<28} {memoria / len(datos):6.1f} bytes/elemento   "
+              f"recorrido {segundos * 1e9 / len(datos):6.1f} ns/elemento")
+        del lista
+
+# === Caché sobre ListaDoble: costo por operación según la capacidad ===
+def bench_cache(args):
+    from functools import lru_cache
+
+    import cache
+
+    generador = random.Random(1)
+    for capacidad in (1_000, args.capacidad):
+        # Claves con repetición: la mitad de las lecturas cae dentro de la capacidad
+        claves = [generador.randrange(capacidad * 2) for _ in range(args.operaciones)]
+        for politica in cache.POLITICAS:
+            c = cache.Cache(capacidad, politica, ttl=60 if politica == "ttl" else None)
+
+            def operar():
+                for clave in claves:
+                    if c.obtener(clave) is None:
+                        c.guardar(clave, clave)
+
+            segundos = medir(operar, 1)
+            reportar(f"{politica} ({capacidad:,})", segundos, len(claves))
+            print(f"{'':<28} aciertos {c.aciertos:,}   fallos {c.fallos:,}   desalojos {c.desalojos:,}")
+
+        # Como decorador, frente a functools.lru_cache con la misma capacidad
+        memorizada = cache.Cache(capacidad)(abs)
+        referencia = lru_cache(maxsize=capacidad)(abs)
+        reportar(f"@Cache ({capacidad:,})", medir(lambda: [memorizada(c) for c in claves], 1), len(claves))
+        reportar(f"@lru_cache ({capacidad:,})", medir(lambda: [referencia(c) for c in claves], 1), len(claves))
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de las estructuras de datos y el conversor.")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    importacion = subparsers.add_parser("importacion", help="Verifica que el núcleo cargue sin Tkinter y a tiempo.")
+    importacion.add_argument("--presupuesto", type=float, default=50, help="Tiempo máximo en milisegundos.")
+    importacion.set_defaults(funcion=bench_importacion)
+
+    conversion = subparsers.add_parser("conversion", help="Infija a postfija sobre expresiones grandes.")
+    conversion.add_argument("--tokens", type=int, default=1_000_000, help="Tokens de la expresión más grande.")
+    conversion.add_argument("--repeticiones", type=int, default=3)
+    conversion.set_defaults(funcion=bench_conversion)
+
+    bitacora = subparsers.add_parser("bitacora", help="Pasos de una conversión grande dibujados por ventanas.")
+    bitacora.add_argument("--tokens", type=int, default=100_000)
+    bitacora.add_argument("--ventanas", type=int, default=1000, help="Repintados a medir.")
+    bitacora.set_defaults(funcion=bench_bitacora)
+
+    evaluador = subparsers.add_parser("evaluador", help="Bytecode de postfija frente a convertir y usar eval.")
+    evaluador.add_argument("--asignaciones", type=int, default=20_000, help="Valores distintos de las variables.")
+    evaluador.add_argument("--repeticiones", type=int, default=3)
+    evaluador.set_defaults(funcion=bench_evaluador)
+
+    infija = subparsers.add_parser("infija", help="Postfija a infija con el árbol y paso a paso.")
+    infija.add_argument("--tokens", type=int, default=1_000_000)
+    infija.set_defaults(funcion=bench_infija)
+
+    notaciones = subparsers.add_parser("notaciones", help="Conversiones entre infija, postfija y prefija.")
+    notaciones.add_argument("--tokens", type=int, default=1_000_000)
+    notaciones.add_argument("--lineas", type=int, default=100_000, help="Líneas para el conversor en lote.")
+    notaciones.set_defaults(funcion=bench_notaciones)
+
+    listas = subparsers.add_parser("listas", help="Carga de ListaSimple y borrado por valor en ListaDoble.")
+    listas.add_argument("--elementos", type=int, default=1_000_000)
+    listas.add_argument("--eliminaciones", type=int, default=2_000, help="Borrados por valor en ListaDoble.")
+    listas.set_defaults(funcion=bench_listas)
+
+    memoria = subparsers.add_parser("cache", help="Cache LRU, LFU y TTL sobre ListaDoble.")
+    memoria.add_argument("--capacidad", type=int, default=100_000, help="Capacidad de la caché más grande.")
+    memoria.add_argument("--operaciones", type=int, default=500_000)
+    memoria.set_defaults(funcion=bench_cache)
+
+    memoria_nodos = subparsers.add_parser("memoria", help="Bytes por elemento y recorrido de cada lista doble.")
+    memoria_nodos.add_argument("--elementos", type=int, default=1_000_000)
+    memoria_nodos.add_argument("--repeticiones", type=int, default=5)
+    memoria_nodos.set_defaults(funcion=bench_memoria)
+
+    args = parser.parse_args()
+    args.funcion(args)
+
+if __name__ == "__main__":
+    main()
+
+#¿Cómo ejecutar?
+#python benchmarks.py <benchmark> [opciones]
+#Ejemplo:
+# python benchmarks.py importacion
+# python benchmarks.py conversion --tokens 1000000
+# python benchmarks.py bitacora --tokens 100000
+# python benchmarks.py evaluador --asignaciones 20000
+# python benchmarks.py infija --tokens 1000000
+# python benchmarks.py notaciones --tokens 1000000
+# python benchmarks.py listas --elementos 1000000
+# python benchmarks.py cache --capacidad 100000
+# python benchmarks.py memoria --elementos 1000000
@@ -0,0 +1,282 @@
+"""
+Caché acotada sobre ListaDoble, sin dependencias de interfaz gráfica.
+
+Cada política de desalojo guarda las claves en nodos de ListaDoble y los mueve
+o quita en O(1) con mover_al_inicio y eliminar_nodo. La caché también sirve
+como decorador para memorizar funciones costosas.
+"""
+
+import time
+from functools import wraps
+
+from Listas import ListaDoble
+
+class PoliticaLRU:
+    """
+    Desaloja la clave usada hace más tiempo (Least Recently Used).
+
+    Atributos:
+        lista: ListaDoble con las claves, de la más reciente (cabeza) a la más antigua (cola).
+        nodos: Diccionario clave -> NodoDoble de la lista.
+    """
+    def __init__(self):
+        """Inicializa la política sin claves."""
+        self.lista = ListaDoble()
+        self.nodos = {}
+
+    def agregar(self, clave):
+        """Registra una clave nueva como la más reciente."""
+        self.nodos[clave] = self.lista.insertar_inicio(clave)
+
+    def usar(self, clave):
+        """Registra una lectura de la clave."""
+        self.lista.mover_al_inicio(self.nodos[clave])
+
+    def renovar(self, clave):
+        """Registra que la clave recibió un valor nuevo."""
+        self.usar(clave)
+
+    def quitar(self, clave):
+        """Olvida una clave que salió de la caché."""
+        self.lista.eliminar_nodo(self.nodos.pop(clave))
+
+    def victima(self):
+        """Retorna la clave que se debe desalojar."""
+        return self.lista.cola.dato
+
+class PoliticaTTL(PoliticaLRU):
+    """
+    Desaloja la clave que vence primero. Como todas duran lo mismo, es la que
+    se guardó hace más tiempo: leerla no cambia su lugar, guardarla de nuevo sí.
+    """
+    def usar(self, clave):
+        """Las lecturas no alargan la vida de la clave."""
+
+    def renovar(self, clave):
+        """Un valor nuevo vence más tarde: la clave pasa a la cabeza."""
+        self.lista.mover_al_inicio(self.nodos[clave])
+
+class PoliticaLFU:
+    """
+    Desaloja la clave usada menos veces (Least Frequently Used); entre las
+    empatadas, la usada hace más tiempo.
+
+    Atributos:
+        cubetas: Diccionario frecuencia -> ListaDoble con las claves de esa frecuencia.
+        nodos: Diccionario clave -> NodoDoble dentro de su cubeta.
+        frecuencias: Diccionario clave -> número de usos.
+        minima: Frecuencia más baja entre las claves presentes.
+    """
+    def __init__(self):
+        """Inicializa la política sin claves."""
+        self.cubetas = {}
+        self.nodos = {}
+        self.frecuencias = {}
+        self.minima = 0
+
+    def _entrar(self, clave, frecuencia):
+        """Pone la clave en la cabeza de la cubeta de su frecuencia."""
+        if frecuencia not in self.cubetas:
+            self.cubetas[frecuencia] = ListaDoble()
+        self.nodos[clave] = self.cubetas[frecuencia].insertar_inicio(clave)
+        self.frecuencias[clave] = frecuencia
+
+    def _salir(self, clave):
+        """Saca la clave de su cubeta y retorna su frecuencia."""
+        frecuencia = self.frecuencias.pop(clave)
+        cubeta = self.cubetas[frecuencia]
+        cubeta.eliminar_nodo(self.nodos.pop(clave))
+        if cubeta.esta_vacia():
+            del self.cubetas[frecuencia]
+        return frecuencia
+
+    def agregar(self, clave):
+        """Registra una clave nueva con un uso."""
+        self._entrar(clave, 1)
+        self.minima = 1
+
+    def usar(self, clave):
+        """Sube en uno la frecuencia de la clave."""
+        frecuencia = self._salir(clave)
+        if frecuencia == self.minima and frecuencia not in self.cubetas:
+            self.minima = frecuencia + 1
+        self._entrar(clave, frecuencia + 1)
+
+    def renovar(self, clave):
+        """Guardar un valor nuevo cuenta como un uso."""
+        self.usar(clave)
+
+    def quitar(self, clave):
+        """Olvida una clave que salió de la caché."""
+        self._salir(clave)
+
+    def victima(self):
+        """Retorna la clave que se debe desalojar."""
+        if self.minima not in self.cubetas:
+            # Solo pasa tras quitar claves a mano: se busca la frecuencia más baja
+            self.minima = min(self.cubetas)
+        return self.cubetas[self.minima].cola.dato
+
+POLITICAS = {'lru': PoliticaLRU, 'lfu': PoliticaLFU, 'ttl': PoliticaTTL}
+
+_AUSENTE = object()  # Distingue "no está en la caché" de un valor None guardado
+_SEPARADOR = object()  # Separa los argumentos posicionales de los nombrados en la clave
+
+class Cache:
+    """
+    Caché de capacidad fija con obtener/guardar/desalojar en O(1).
+
+    Atributos:
+        capacidad: Número máximo de claves.
+        politica: Objeto que decide qué clave desalojar (ver POLITICAS).
+        ttl: Segundos que dura un valor, o None si no vencen.
+        aciertos: Lecturas que encontraron la clave.
+        fallos: Lecturas que no la encontraron (o la encontraron vencida).
+        desalojos: Claves quitadas por falta de espacio.
+        vencidos: Claves quitadas porque pasó su ttl.
+    """
+    def __init__(self, capacidad, politica='lru', ttl=None, reloj=time.monotonic):
+        """Inicializa una caché vacía.
+
+        Args:
+            capacidad: Número máximo de claves (al menos 1).
+            politica: 'lru', 'lfu', 'ttl' o un objeto con agregar, usar, renovar,
+                quitar y victima.
+            ttl: Segundos que dura cada valor; obligatorio con la política 'ttl'.
+            reloj: Función que retorna la hora actual en segundos.
+
+        Raises:
+            ValueError: Si la capacidad, la política o el ttl no son válidos.
+        """
+        if capacidad < 1:
+            raise ValueError("La capacidad debe ser al menos 1")
+        if isinstance(politica, str):
+            if politica not in POLITICAS:
+                raise ValueError(f"Política desconocida: {politica}")
+            if politica == 'ttl' and ttl is None:
+                raise ValueError("La política 'ttl' necesita un ttl")
+            politica = POLITICAS[politica]()
+        self.capacidad = capacidad
+        self.politica = politica
+        self.ttl = ttl
+        self.reloj = reloj
+        self.datos = {}  # Clave -> (valor, instante en que vence o None)
+        self.aciertos = self.fallos = self.desalojos = self.vencidos = 0
+
+    def __len__(self):
+        return len(self.datos)
+
+    def __contains__(self, clave):
+        # No cuenta como lectura: no cambia contadores ni el orden de desalojo
+        entrada = self.datos.get(clave)
+        return entrada is not None and (entrada[1] is None or self.reloj() < entrada[1])
+
+    def obtener(self, clave, defecto=None):
+        """Retorna el valor guardado para la clave.
+
+        Args:
+            clave: Clave a buscar (hashable).
+            defecto: Valor que se retorna si la clave no está o ya venció.
+        """
+        entrada = self.datos.get(clave)
+        if entrada is None:
+            self.fallos += 1
+            return defecto
+        if entrada[1] is not None and self.reloj() >= entrada[1]:
+            self._quitar(clave)
+            self.vencidos += 1
+            self.fallos += 1
+            return defecto
+        self.aciertos += 1
+        self.politica.usar(clave)
+        return entrada[0]
+
+    def guardar(self, clave, valor):
+        """Guarda el valor de la clave, desalojando otra si la caché está llena.
+
+        Args:
+            clave: Clave (hashable).
+            valor: Valor a guardar.
+        """
+        vence = None if self.ttl is None else self.reloj() + self.ttl
+        if clave in self.datos:
+            self.datos[clave] = (valor, vence)
+            self.politica.renovar(clave)
+            return
+        if len(self.datos) >= self.capacidad:
+            victima = self.politica.victima()
+            entrada = self.datos[victima]
+            self._quitar(victima)
+            if entrada[1] is not None and self.reloj() >= entrada[1]:
+                self.vencidos += 1  # Ya había vencido: no se perdió nada útil
+            else:
+                self.desalojos += 1
+        self.datos[clave] = (valor, vence)
+        self.politica.agregar(clave)
+
+    def eliminar(self, clave):
+        """Quita la clave de la caché.
+
+        Returns:
+            bool: True si la clave estaba, False en caso contrario.
+        """
+        if clave not in self.datos:
+            return False
+        self._quitar(clave)
+        return True
+
+    def _quitar(self, clave):
+        del self.datos[clave]
+        self.politica.quitar(clave)
+
+    def limpiar(self):
+        """Vacía la caché y pone los contadores en cero."""
+        for clave in list(self.datos):
+            self._quitar(clave)
+        self.aciertos = self.fallos = self.desalojos = self.vencidos = 0
+
+    def estadisticas(self):
+        """Retorna los contadores de la caché.
+
+        Returns:
+            dict: aciertos, fallos, desalojos, vencidos, tamano, capacidad y
+                tasa_aciertos (entre 0 y 1).
+        """
+        lecturas = self.aciertos + self.fallos
+        return {
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'desalojos': self.desalojos,
+            'vencidos': self.vencidos,
+            'tamano': len(self.datos),
+            'capacidad': self.capacidad,
+            'tasa_aciertos': self.aciertos / lecturas if lecturas else 0.0,
+        }
+
+    def __call__(self, funcion):
+        """Usa la caché como decorador: memoriza los resultados de la función.
+
+        Los argumentos forman la clave, así que deben ser hashables. Si la función
+        lanza una excepción, no se guarda nada. La caché queda en funcion.cache.
+        """
+        @wraps(funcion)
+        def memorizada(*args, **kwargs):
+            # Como kwd_mark en functools: ninguna llamada solo con posicionales
+            # puede producir la misma clave, porque _SEPARADOR nunca es un argumento
+            clave = args + (_SEPARADOR,) + tuple(sorted(kwargs.items())) if kwargs else args
+            resultado = self.obtener(clave, _AUSENTE)
+            if resultado is _AUSENTE:
+                resultado = funcion(*args, **kwargs)
+                self.guardar(clave, resultado)
+            return resultado
+        memorizada.cache = self
+        return memorizada
+
+#¿Cómo usar?
+#cache = Cache(1000, politica="lfu")
+#cache.guardar("x", 1); cache.obtener("x")            -> 1
+#cache.estadisticas()                                  -> {'aciertos': 1, 'fallos': 0, ...}
+#
+#@Cache(256, politica="ttl", ttl=30)
+#def analizar(expresion): ...
+#analizar.cache.estadisticas()
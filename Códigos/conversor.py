@@ -0,0 +1,55 @@
+import argparse
+import sys
+
+from App import convertir, notaciones
+
+
+def convertir_lineas(lineas, origen, destino, parentesis_minimos=False):
+    # Produce None (línea vacía), (True, conversión) o (False, mensaje) por cada
+    # línea, a medida que se leen: la entrada nunca se carga completa en memoria
+    for linea in lineas:
+        if not linea.strip():
+            yield None
+            continue
+        try:
+            yield True, convertir(linea, origen, destino, parentesis_minimos)
+        except ValueError as e:
+            yield False, str(e)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convierte en lote expresiones entre notación infija, postfija y prefija, una por línea."
+    )
+    parser.add_argument("origen", choices=list(notaciones), help="Notación de la entrada.")
+    parser.add_argument("destino", choices=list(notaciones), help="Notación de la salida.")
+    parser.add_argument("archivo", nargs="?", help="Archivo de expresiones (por defecto, stdin).")
+    parser.add_argument("-m", "--parentesis-minimos", action="store_true",
+                        help="En infija, escribir solo los paréntesis necesarios.")
+
+    args = parser.parse_args()
+
+    entrada = open(args.archivo) if args.archivo else sys.stdin
+    errores = 0
+    with entrada:
+        resultados = convertir_lineas(entrada, args.origen, args.destino, args.parentesis_minimos)
+        for numero, resultado in enumerate(resultados, 1):
+            if resultado is None:
+                print()
+            elif resultado[0]:
+                print(resultado[1])
+            else:
+                errores += 1
+                print(f"Línea {numero}: {resultado[1]}")
+    if errores:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
+
+#¿Cómo ejecutar?
+#python conversor.py <origen> <destino> [archivo] [-m]
+#Ejemplo:
+# python conversor.py infija prefija expresiones.txt
+# type expresiones.txt | python conversor.py postfija infija -m
@@ -0,0 +1,120 @@
+import operator
+from array import array
+
+from App import convertir_infija_a_postfija, es_operando, precedencia, tokenizar
+
+# === Bytecode de la máquina de pila ===
+# Cada instrucción es un código de operación (array('B')) y un argumento
+# (array('I')): el índice en la tabla de constantes o en la de variables
+CARGAR_CONSTANTE = 0
+CARGAR_VARIABLE = 1
+SUMAR = 2
+RESTAR = 3
+MULTIPLICAR = 4
+DIVIDIR = 5
+POTENCIA = 6
+
+codigos_operadores = {'+': SUMAR, '-': RESTAR, '*': MULTIPLICAR, '/': DIVIDIR, '^': POTENCIA}
+# Indexada por código de operación; las dos primeras posiciones son las cargas
+_operaciones = (None, None, operator.add, operator.sub, operator.mul, operator.truediv, operator.pow)
+
+
+def _constante(token):
+    return float(token) if '.' in token else int(token)
+
+
+# Programa compilado: se construye una vez y se evalúa con tantas
+# asignaciones de variables como se quiera. El programa no guarda estado
+# entre evaluaciones: cada llamada usa su propia pila de valores, así que se
+# puede evaluar desde varios hilos a la vez
+class ProgramaRPN:
+    def __init__(self, codigos, argumentos, constantes, nombres, profundidad):
+        self.codigos = codigos
+        self.argumentos = argumentos
+        self.constantes = constantes
+        self.nombres = nombres
+        self.profundidad = profundidad  # Altura máxima que alcanza la pila
+
+    def __len__(self):
+        return len(self.codigos)
+
+    def evaluar(self, variables=None):
+        return self._ejecutar(variables, [None] * self.profundidad)
+
+    def evaluar_muchos(self, asignaciones):
+        # Un resultado por cada diccionario de variables; la pila se reserva
+        # una vez por llamada y se reutiliza en todas las asignaciones
+        pila = [None] * self.profundidad
+        return [self._ejecutar(variables, pila) for variables in asignaciones]
+
+    def _ejecutar(self, variables, pila):
+        if variables is None:
+            variables = {}
+        try:
+            valores = [variables[nombre] for nombre in self.nombres]
+        except KeyError as e:
+            raise ValueError(f"Variable sin valor: {e.args[0]}") from None
+
+        constantes = self.constantes
+        cima = 0  # Primera posición libre de la pila
+        for codigo, argumento in zip(self.codigos, self.argumentos):
+            if codigo == CARGAR_CONSTANTE:
+                pila[cima] = constantes[argumento]
+                cima += 1
+            elif codigo == CARGAR_VARIABLE:
+                pila[cima] = valores[argumento]
+                cima += 1
+            else:
+                cima -= 1
+                pila[cima - 1] = _operaciones[codigo](pila[cima - 1], pila[cima])
+        return pila[0]
+
+
+# Compila una expresión postfija (texto o lista de tokens) a bytecode. El texto
+# se separa con tokenizar, igual que en la GUI: "a b+" vale y "3x" son dos tokens
+# Lanza ValueError si la expresión postfija no es válida
+def compilar_postfija(expresion):
+    tokens = tokenizar(expresion) if isinstance(expresion, str) else expresion
+    codigos = array('B')
+    argumentos = array('I')
+    constantes = []
+    indices_constantes = {}
+    indices_variables = {}
+    altura = profundidad = 0
+
+    for token in tokens:
+        if es_operando(token):
+            if token[0].isdigit():
+                if token not in indices_constantes:
+                    indices_constantes[token] = len(constantes)
+                    constantes.append(_constante(token))
+                codigos.append(CARGAR_CONSTANTE)
+                argumentos.append(indices_constantes[token])
+            else:
+                codigos.append(CARGAR_VARIABLE)
+                argumentos.append(indices_variables.setdefault(token, len(indices_variables)))
+            altura += 1
+            profundidad = max(profundidad, altura)
+        elif token in precedencia:
+            if altura < 2:
+                raise ValueError("Expresión postfija inválida")
+            codigos.append(codigos_operadores[token])
+            argumentos.append(0)
+            altura -= 1
+        else:
+            raise ValueError("Expresión postfija inválida")
+
+    if altura != 1:
+        raise ValueError("Expresión postfija inválida")
+    return ProgramaRPN(codigos, argumentos, constantes, list(indices_variables), profundidad)
+
+
+def compilar_infija(expresion):
+    salida, _ = convertir_infija_a_postfija(tokenizar(expresion))
+    return compilar_postfija(salida)
+
+
+#¿Cómo usar?
+#programa = compilar_infija("x1 * (y + 2) ^ 2")
+#programa.evaluar({"x1": 3, "y": 1})                       -> 27
+#programa.evaluar_muchos([{"x1": 1, "y": 0}, {"x1": 2, "y": 1}])
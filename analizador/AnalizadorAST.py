@@ -1,11 +1,14 @@
 import ast
-import tkinter as tk
-from tkinter import messagebox, scrolledtext
+import re
+from functools import lru_cache
+from itertools import chain, repeat
+
+from optimizador import optimizar
 
 # === Tokens ===
-NUMBER, PLUS, MINUS, TIMES, DIVIDE, LPAREN, RPAREN, ASSIGN, ID, EOF = (
-    'NUMBER', 'PLUS', 'MINUS', 'TIMES', 'DIVIDE', 'LPAREN', 'RPAREN', 'ASSIGN', 'ID', 'EOF'
-)
+# Los tipos son enteros compartidos con tokens.py (NOMBRES da su nombre)
+from tokens import NUMBER, PLUS, MINUS, TIMES, DIVIDE, LPAREN, RPAREN, ASSIGN, ID, EOF, NOMBRES
+from tokens import Diagnostico, LexerTokens
 
 # === Lexer ===
 class Lexer:
@@ -71,6 +74,53 @@ class Lexer:
             raise Exception(f'Carácter no válido: {self.current_char}')
         return (EOF, None)
 
+# === Lexer con expresión regular ===
+_PATRON_LEXEMAS = re.compile(r'\d+|[^\W\d]\w*|[-+*/()=]|\S')
+
+_OPERADORES = {
+    '+': (PLUS, '+'), '-': (MINUS, '-'), '*': (TIMES, '*'), '/': (DIVIDE, '/'),
+    '(': (LPAREN, '('), ')': (RPAREN, ')'), '=': (ASSIGN, '='),
+}
+
+class _TablaTokens(dict):
+    # Lexema -> token; cada lexema distinto se clasifica una sola vez
+    def __init__(self):
+        super().__init__(_OPERADORES)
+        self.invalido = None
+
+    def __missing__(self, lexema):
+        if lexema[0].isdigit():
+            token = (NUMBER, int(lexema))
+        elif lexema[0].isalpha() or lexema[0] == '_':
+            token = (ID, lexema)
+        else:
+            if self.invalido is None:
+                self.invalido = lexema
+            return None
+        self[lexema] = token
+        return token
+
+class LexerRegex:
+    # Misma interfaz y mismos tokens que Lexer, pero el texto se recorre con un
+    # único patrón compilado y la clasificación de cada lexema se hace en C (map)
+    def __init__(self, text):
+        self.text = text
+        tabla = _TablaTokens()
+        tokens = list(map(tabla.__getitem__, _PATRON_LEXEMAS.findall(text)))
+        if tabla.invalido is not None:
+            del tokens[tokens.index(None):]
+            resto = self._error(tabla.invalido)
+        else:
+            resto = repeat((EOF, None))
+        self.tokens = tokens
+        self.get_next_token = chain(tokens, resto).__next__
+
+    @staticmethod
+    def _error(caracter):
+        # Generador que falla al ser alcanzado, igual que Lexer al llegar al carácter
+        raise Exception(f'Carácter no válido: {caracter}')
+        yield
+
 # === Parser ===
 class Parser:
     def __init__(self, lexer):
@@ -81,7 +131,8 @@ class Parser:
         if self.current_token[0] == token_type:
             self.current_token = self.lexer.get_next_token()
         else:
-            raise Exception(f'Error de sintaxis: se esperaba {token_type}, se recibió {self.current_token[0]}')
+            raise Exception(f'Error de sintaxis: se esperaba {NOMBRES[token_type]}, '
+                            f'se recibió {NOMBRES[self.current_token[0]]}')
 
     def factor(self):
         token_type, value = self.current_token
@@ -97,7 +148,7 @@ class Parser:
             self.eat(RPAREN)
             return node
         else:
-            raise Exception(f'Factor inesperado {token_type}')
+            raise Exception(f'Factor inesperado {NOMBRES[token_type]}')
 
     def term(self):
         node = self.factor()
@@ -133,10 +184,19 @@ class Parser:
             else:
                 # No era asignación, tratamos el identificador como parte de una expresión
                 left = ast.Name(id=var_name, ctx=ast.Load())
-                return self.expr_rest(left)
+                return self.expr_rest(self.term_rest(left))
         else:
             return self.expr()
 
+    def term_rest(self, left):
+        while self.current_token[0] in (TIMES, DIVIDE):
+            token_type = self.current_token[0]
+            self.eat(token_type)
+            right = self.factor()
+            op = ast.Mult() if token_type == TIMES else ast.Div()
+            left = ast.BinOp(left=left, op=op, right=right)
+        return left
+
     def expr_rest(self, left):
         while self.current_token[0] in (PLUS, MINUS):
             token_type = self.current_token[0]
@@ -150,43 +210,302 @@ class Parser:
         node = self.assignment()
         return ast.Expression(body=node)
 
-# === Función del botón ===
-def analizar_expresion():
-    entrada = entry.get()
-    try:
-        lexer = Lexer(entrada)
-        parser = Parser(lexer)
-        tree = parser.parse()
-        resultado = ast.dump(tree, indent=4)
+# === Parser iterativo ===
+_PRECEDENCIA = {PLUS: 1, MINUS: 1, TIMES: 2, DIVIDE: 2}
+_OPERACIONES_AST = {PLUS: ast.Add, MINUS: ast.Sub, TIMES: ast.Mult, DIVIDE: ast.Div}
+
+class ParserIterativo(Parser):
+    # Construye los mismos árboles, con los mismos mensajes de error, que Parser,
+    # pero con pilas explícitas de operandos y operadores en lugar de recursión:
+    # la memoria crece con la profundidad de los paréntesis y no depende de
+    # sys.getrecursionlimit()
+    def expr(self, operando=None):
+        operandos = [] if operando is None else [operando]
+        operadores = []
+
+        def reducir(precedencia_minima):
+            while operadores and operadores[-1] != LPAREN and _PRECEDENCIA[operadores[-1]] >= precedencia_minima:
+                right = operandos.pop()
+                left = operandos.pop()
+                operandos.append(ast.BinOp(left=left, op=_OPERACIONES_AST[operadores.pop()](), right=right))
+
+        esperando_factor = operando is None
+        while True:
+            if esperando_factor:
+                operandos.append(self._operando(operadores))
+
+            token_type = self.current_token[0]
+            if token_type in _PRECEDENCIA:
+                reducir(_PRECEDENCIA[token_type])
+                operadores.append(token_type)
+                self.eat(token_type)
+                esperando_factor = True
+                continue
+
+            reducir(0)
+            if not operadores:
+                return operandos.pop()
+            # Solo queda un paréntesis abierto en la cima: hay que cerrarlo
+            self.eat(RPAREN)
+            operadores.pop()
+            esperando_factor = False
+
+    def _operando(self, operadores):
+        # Abre los paréntesis que haya (en la pila de operadores) y lee el
+        # número o identificador que sigue
+        while True:
+            token_type, value = self.current_token
+            if token_type == LPAREN:
+                operadores.append(LPAREN)
+                self.eat(LPAREN)
+            elif token_type == NUMBER:
+                self.eat(NUMBER)
+                return ast.Constant(value=value)
+            elif token_type == ID:
+                self.eat(ID)
+                return ast.Name(id=value, ctx=ast.Load())
+            else:
+                operando = self._factor_inesperado()
+                if operando is not None:
+                    return operando
+                # Se descartaron tokens hasta uno que puede empezar un factor
+
+    def _factor_inesperado(self):
+        # Devuelve el nodo que reemplaza al factor que falta, o None para volver
+        # a leerlo desde el token actual; aquí no hay recuperación
+        raise Exception(f'Factor inesperado {NOMBRES[self.current_token[0]]}')
+
+    def assignment(self):
+        if self.current_token[0] == ID:
+            var_name = self.current_token[1]
+            self.eat(ID)
+            if self.current_token[0] == ASSIGN:
+                self.eat(ASSIGN)
+                return ast.Assign(
+                    targets=[ast.Name(id=var_name, ctx=ast.Store())],
+                    value=self.expr()
+                )
+            return self.expr(ast.Name(id=var_name, ctx=ast.Load()))
+        return self.expr()
+
+# === Parser con recuperación de errores ===
+_INICIO_FACTOR = (NUMBER, ID, LPAREN)
+_SIGUIENTES_FACTOR = (PLUS, MINUS, TIMES, DIVIDE, RPAREN, EOF)
+_FIN_SENTENCIA = (PLUS, MINUS, TIMES, DIVIDE, EOF)
+
+class ParserRecuperable(ParserIterativo):
+    # Igual que ParserIterativo, y como él sin límite de profundidad, pero cada
+    # error se anota en self.diagnosticos y el análisis sigue: un paréntesis de
+    # cierre que falta se da por puesto, un factor que falta se reemplaza por
+    # Constant(None) y los tokens que sobran se descartan (modo pánico) hasta
+    # uno donde se pueda continuar.
+    # Necesita un LexerTokens para conocer la línea y la columna
+    def __init__(self, lexer):
+        self.diagnosticos = []
+        lexer.al_invalido = self._caracter_invalido
+        super().__init__(lexer)
+
+    def _caracter_invalido(self, linea, columna, caracter):
+        self.diagnosticos.append(Diagnostico(linea, columna, (), caracter))
+
+    def _anotar(self, esperados):
+        linea, columna = self.lexer.posicion_actual()
+        anterior = self.diagnosticos[-1] if self.diagnosticos else None
+        if anterior is not None and (anterior.linea, anterior.columna) == (linea, columna):
+            return  # Un error en cascada sobre el mismo token no aporta nada
+        self.diagnosticos.append(
+            Diagnostico(linea, columna, (NOMBRES[t] for t in esperados), NOMBRES[self.current_token[0]])
+        )
+
+    def _descartar_hasta(self, sincronizacion):
+        while self.current_token[0] not in sincronizacion:
+            self.current_token = self.lexer.get_next_token()
+
+    def eat(self, token_type):
+        if self.current_token[0] == token_type:
+            self.current_token = self.lexer.get_next_token()
+            return
+        self._anotar((token_type,))
+        if token_type == RPAREN:
+            return  # Se da por puesto el paréntesis que falta
+        self._descartar_hasta((token_type, EOF))
+        if self.current_token[0] == token_type != EOF:
+            self.current_token = self.lexer.get_next_token()
+
+    def _factor_inesperado(self):
+        self._anotar(_INICIO_FACTOR)
+        if self.current_token[0] not in _SIGUIENTES_FACTOR:
+            self._descartar_hasta(_INICIO_FACTOR + _SIGUIENTES_FACTOR)
+            if self.current_token[0] in _INICIO_FACTOR:
+                return None  # Se sigue desde el factor encontrado
+        return ast.Constant(value=None)
+
+    def parse(self):
+        tree = super().parse()
+        if self.current_token[0] != EOF:  # Lo que quede después de la expresión también es un error
+            self._anotar(_FIN_SENTENCIA)
+            self._descartar_hasta((EOF,))
+        return tree
+
+def diagnosticar(texto):
+    # Analiza el texto completo sin detenerse en el primer error.
+    # Devuelve (árbol, lista de Diagnostico); el árbol solo es válido si la lista está vacía
+    parser = ParserRecuperable(LexerTokens(texto))
+    tree = parser.parse()
+    return tree, parser.diagnosticos
+
+# === Compilación con caché ===
+TAMANO_CACHE = 1024
+_GLOBALES = {"__builtins__": {}}
+
+def normalizar_fuente(texto):
+    # Colapsamos los espacios para que "a+b" y " a + b " no ocupen dos entradas
+    return " ".join(texto.split())
+
+@lru_cache(maxsize=TAMANO_CACHE)
+def _compilar_fuente(fuente):
+    parser = ParserIterativo(LexerRegex(fuente))
+    tree = parser.parse()
+    parser.eat(EOF)  # Lo que sobre después de la expresión es un error, no se ignora
+    tree = optimizar(tree)
+    if isinstance(tree.body, ast.Assign):
+        # En modo 'eval' la asignación se expresa como (x := valor)
+        asignacion = tree.body
+        tree.body = ast.NamedExpr(target=asignacion.targets[0], value=asignacion.value)
+    ast.fix_missing_locations(tree)
+    return compile(tree, '<expresion>', 'eval')
+
+def compilar(texto):
+    return _compilar_fuente(normalizar_fuente(texto))
+
+def evaluar(texto, variables=None):
+    # Las asignaciones quedan guardadas en el diccionario de variables
+    if variables is None:
+        variables = {}
+    return eval(compilar(texto), _GLOBALES, variables)
+
+def limpiar_cache():
+    _compilar_fuente.cache_clear()
+
+def info_cache():
+    return _compilar_fuente.cache_info()
+
+# === Interfaz gráfica ===
+# Tkinter se importa dentro de main() para que Lexer y Parser se puedan usar sin él
+LINEAS_VISIBLES = 20
+def main():
+    import tkinter as tk
+    from tkinter import messagebox
+
+    from incremental import ArbolIncremental
+    from vista_arbol import VistaArbol
+
+    # Guarda los tokens y los subárboles del último análisis: cada tecla solo
+    # vuelve a analizar los grupos que encierran lo que cambió
+    analisis = ArbolIncremental()
+
+    # El árbol se muestra como una vista que se expande con un clic; el cuadro
+    # de texto solo tiene las líneas visibles y nunca se arma el dump completo
+    estado_vista = {"vista": None, "primera": 0}
+
+    def repintar():
+        vista = estado_vista["vista"]
+        total = max(vista.total_lineas, 1)
+        estado_vista["primera"] = max(0, min(estado_vista["primera"], vista.total_lineas - LINEAS_VISIBLES))
+        lineas = vista.lineas(estado_vista["primera"], LINEAS_VISIBLES)
         salida.config(state='normal')
         salida.delete(1.0, tk.END)
-        salida.insert(tk.END, resultado)
+        salida.insert(tk.END, "\n".join(lineas))
         salida.config(state='disabled')
-    except Exception as e:
-        messagebox.showerror("Error de análisis", str(e))
+        barra.set(estado_vista["primera"] / total, min(1.0, (estado_vista["primera"] + LINEAS_VISIBLES) / total))
 
-# === Interfaz gráfica ===
-ventana = tk.Tk()
-ventana.title("Analizador Sintáctico - AST Visualizer")
-ventana.geometry("700x500")
-ventana.config(bg="#e0f7fa")
+    def desplazar(accion, cantidad, unidad=None):
+        if estado_vista["vista"] is None:
+            return
+        if accion == "moveto":
+            estado_vista["primera"] = int(float(cantidad) * estado_vista["vista"].total_lineas)
+        else:
+            paso = LINEAS_VISIBLES if unidad == "pages" else 1
+            estado_vista["primera"] += int(cantidad) * paso
+        repintar()
+
+    def rueda(evento):
+        if getattr(evento, "num", None) == 4 or getattr(evento, "delta", 0) > 0:
+            desplazar("scroll", -3)
+        else:
+            desplazar("scroll", 3)
+        return "break"  # El cuadro de texto no debe desplazarse por su cuenta
+
+    def clic(evento):
+        # Abre o cierra el nodo de la línea pulsada
+        if estado_vista["vista"] is None:
+            return "break"
+        linea = int(salida.index(f"@{evento.x},{evento.y}").split(".")[0])
+        indice = estado_vista["primera"] + linea - 1
+        if indice < estado_vista["vista"].total_lineas and estado_vista["vista"].alternar(indice):
+            repintar()
+        return "break"
+
+    # === Análisis en cada tecla ===
+    def revisar_expresion(evento=None):
+        tree, diagnosticos = analisis.actualizar(entry.get())
+        if diagnosticos:
+            estado.config(text=str(diagnosticos[0]), fg="#c62828")
+        else:
+            estado.config(text=f"Expresión válida ({analisis.reanalizados} grupos reanalizados)", fg="#2e7d32")
+
+    # === Función del botón ===
+    def analizar_expresion():
+        entrada = entry.get()
+        try:
+            tree, diagnosticos = analisis.actualizar(entrada)
+            if diagnosticos:
+                # Todos los errores de una vez, no solo el primero
+                messagebox.showerror("Error de análisis", "\n".join(map(str, diagnosticos)))
+                return
+            estado_vista["vista"] = VistaArbol(tree)
+            estado_vista["primera"] = 0
+            repintar()
+        except Exception as e:
+            messagebox.showerror("Error de análisis", str(e))
+
+    ventana = tk.Tk()
+    ventana.title("Analizador Sintáctico - AST Visualizer")
+    ventana.geometry("700x500")
+    ventana.config(bg="#e0f7fa")
+
+    titulo = tk.Label(ventana, text="Analizador Descendente Recursivo", font=("Helvetica", 18, "bold"), bg="#00acc1", fg="white", pady=10)
+    titulo.pack(fill=tk.X)
+
+    frame_input = tk.Frame(ventana, bg="#e0f7fa")
+    frame_input.pack(pady=20)
 
-titulo = tk.Label(ventana, text="Analizador Descendente Recursivo", font=("Helvetica", 18, "bold"), bg="#00acc1", fg="white", pady=10)
-titulo.pack(fill=tk.X)
+    lbl = tk.Label(frame_input, text="Expresión:", font=("Helvetica", 12), bg="#e0f7fa")
+    lbl.grid(row=0, column=0, padx=5)
 
-frame_input = tk.Frame(ventana, bg="#e0f7fa")
-frame_input.pack(pady=20)
+    entry = tk.Entry(frame_input, width=40, font=("Consolas", 14), bd=2, relief="groove")
+    entry.grid(row=0, column=1, padx=5)
 
-lbl = tk.Label(frame_input, text="Expresión:", font=("Helvetica", 12), bg="#e0f7fa")
-lbl.grid(row=0, column=0, padx=5)
+    btn = tk.Button(frame_input, text="Analizar", font=("Helvetica", 12), bg="#00796b", fg="white", padx=20, command=analizar_expresion)
+    btn.grid(row=0, column=2, padx=5)
+    entry.bind("<KeyRelease>", revisar_expresion)
 
-entry = tk.Entry(frame_input, width=40, font=("Consolas", 14), bd=2, relief="groove")
-entry.grid(row=0, column=1, padx=5)
+    estado = tk.Label(ventana, text="", font=("Helvetica", 10), bg="#e0f7fa")
+    estado.pack()
 
-btn = tk.Button(frame_input, text="Analizar", font=("Helvetica", 12), bg="#00796b", fg="white", padx=20, command=analizar_expresion)
-btn.grid(row=0, column=2, padx=5)
+    # Vista del árbol con su barra de desplazamiento (clic en ▸ / ▾ para expandir)
+    marco = tk.Frame(ventana, bg="#e0f7fa")
+    marco.pack(padx=10, pady=10)
+    barra = tk.Scrollbar(marco, command=desplazar)
+    barra.pack(side=tk.RIGHT, fill=tk.Y)
+    salida = tk.Text(marco, width=80, height=LINEAS_VISIBLES, font=("Courier New", 10), bg="#f1f8e9",
+                     wrap="none", cursor="hand2", state='disabled')
+    salida.pack(side=tk.LEFT)
+    salida.bind("<Button-1>", clic)
+    for evento in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+        salida.bind(evento, rueda)
 
-salida = scrolledtext.ScrolledText(ventana, width=80, height=20, font=("Courier New", 10), bg="#f1f8e9", state='disabled')
-salida.pack(padx=10, pady=10)
+    ventana.mainloop()
 
-ventana.mainloop()
+if __name__ == "__main__":
+    main()
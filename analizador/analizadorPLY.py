@@ -1,7 +1,12 @@
+import marshal
+import os
+import sys
+from decimal import Decimal
+from fractions import Fraction
 import ply.lex as lex
 import ply.yacc as yacc
-import tkinter as tk
-from tkinter import messagebox
+
+from tokens import crear_diagnostico
 
 # === 1. DEFINICIÓN DEL ANALIZADOR LÉXICO ===
 tokens = (
@@ -19,7 +24,8 @@ t_EQUAL = r'='
 
 def t_NUMBER(t):
     r'\d+(\.\d*)?'  # Números enteros o flotantes
-    t.value = float(t.value)
+    # El valor queda como texto: cada parser lo convierte con su tipo numérico,
+    # así Decimal y Fraction no pierden precisión pasando por float
     return t
 
 # Caracteres que vamos a ignorar (espacios y saltos de línea)
@@ -27,7 +33,12 @@ t_ignore = ' \t\n'
 
 # Definir la regla para manejar los errores en el análisis léxico
 def t_error(t):
-    print(f"Carácter no reconocido {t.value[0]}")
+    # Con diagnosticar() el carácter se anota en lugar de imprimirse
+    diagnosticos = getattr(t.lexer, 'diagnosticos', None)
+    if diagnosticos is None:
+        print(f"Carácter no reconocido {t.value[0]}")
+    else:
+        diagnosticos.append(crear_diagnostico(t.lexer.lexdata, t.lexpos, (), t.value[0]))
     t.lexer.skip(1)
 
 # Crear el lexer
@@ -58,56 +69,192 @@ def p_expression_group(p):
 
 def p_expression_number(p):
     '''expression : NUMBER'''
-    p[0] = p[1]
+    p[0] = float(p[1])
 
 # Regla de error
 def p_error(p):
-    print("Error de sintaxis: Expresión no válida.")
+    raise SyntaxError("Error de sintaxis: Expresión no válida.")
+
+# Tablas LALR precompiladas: se guardan con marshal junto a la firma de la
+# gramática (_lr_signature) y solo se regeneran cuando la gramática cambia
+TABLAS_PRECOMPILADAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parsetab.bin')
+
+def firma_gramatica():
+    pinfo = yacc.ParserReflect(globals())
+    pinfo.get_all()
+    return pinfo.signature()
+
+def cargar_tablas(firma, ruta=TABLAS_PRECOMPILADAS):
+    try:
+        with open(ruta, 'rb') as archivo:
+            datos = marshal.load(archivo)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(datos, dict) or datos.get('firma') != firma:
+        return None
+    tablas = yacc.LRTable()
+    tablas.lr_method = datos['metodo']
+    tablas.lr_action = datos['action']
+    tablas.lr_goto = datos['goto']
+    tablas.lr_productions = [yacc.MiniProduction(*p) for p in datos['producciones']]
+    return tablas
+
+def guardar_tablas(firma, parser, ruta=TABLAS_PRECOMPILADAS):
+    datos = {
+        'firma': firma,
+        'metodo': 'LALR',
+        'action': parser.action,
+        'goto': parser.goto,
+        'producciones': [(p.str, p.name, p.len, p.func, p.file, p.line) for p in parser.productions],
+    }
+    # Escribimos en un temporal y lo renombramos para que varios procesos no se pisen
+    temporal = f'{ruta}.{os.getpid()}.tmp'
+    try:
+        with open(temporal, 'wb') as archivo:
+            marshal.dump(datos, archivo)
+        os.replace(temporal, ruta)
+    except OSError:
+        pass
+
+# Tipos numéricos disponibles. Solo cambia la conversión de los literales: la
+# suma, resta, producto y división de p_expression_binop ya funcionan con los tres
+NUMEROS = {
+    'float': float,
+    'decimal': Decimal,   # Usa el contexto decimal activo (precisión, redondeo)
+    'fraccion': Fraction,  # Racionales exactos
+}
+
+def _accion_numero(convertir):
+    # No se llama p_...: yacc revisa el archivo y avisaría de una regla repetida
+    def accion(p):
+        p[0] = convertir(p[1])
+    return accion
+
+def crear_parser(numero=float):
+    # numero: float, Decimal, Fraction o cualquier función texto -> número. Se
+    # elige una vez al construir el parser: la acción de cada literal llama
+    # directamente a esa función, sin preguntar el tipo en cada operación
+    acciones = globals()
+    if numero is not float:
+        acciones = dict(acciones, p_expression_number=_accion_numero(numero))
+    firma = firma_gramatica()
+    tablas = cargar_tablas(firma)
+    if tablas is None:
+        nuevo = yacc.yacc(module=sys.modules[__name__], debug=False, write_tables=False)
+        guardar_tablas(firma, nuevo)
+        for produccion in nuevo.productions:
+            if produccion.func:
+                produccion.callable = acciones[produccion.func]
+        return nuevo
+    tablas.bind_callables(acciones)
+    return yacc.LRParser(tablas, p_error)
 
 # Crear el parser
-parser = yacc.yacc()
+parser = crear_parser()
 
 # === 3. FUNCIONES DE EVALUACIÓN ===
-def evaluar_expresion(expresion):
-    lexer.input(expresion)
-    return parser.parse(expresion)
+def evaluar_expresion(expresion, parser=parser):
+    return parser.parse(expresion, lexer=lexer)
 
-# === 4. INTERFAZ GRÁFICA DE USUARIO ===
+# === Recuperación de errores ===
+def _recuperacion(parser, lexer, texto, diagnosticos):
+    # Función de error para diagnosticar(): anota qué tokens aceptaba el estado
+    # del parser (según la tabla LALR) y descarta tokens hasta uno aceptable
+    def recuperar(t):
+        acciones = parser.action[parser.state]
+        esperados = ['EOF' if tipo == '$end' else tipo for tipo in acciones]
+        if t is None:
+            diagnosticos.append(crear_diagnostico(texto, len(texto), esperados, 'EOF'))
+            return None  # Sin más tokens no hay de dónde recuperarse
+        diagnosticos.append(crear_diagnostico(texto, t.lexpos, esperados, t.type))
+        t = lexer.token()
+        while t is not None and t.type not in acciones:
+            t = lexer.token()
+        if t is not None or '$end' in acciones:
+            parser.errok()
+        return t
+    return recuperar
 
-def on_calcular():
-    expresion = entry.get()
+def diagnosticar(texto, parser=parser, lexer=lexer):
+    # Evalúa el texto sin detenerse en el primer error de sintaxis.
+    # Devuelve (resultado, lista de Diagnostico); el resultado solo es válido si la lista está vacía
+    diagnosticos = []
+    funcion_error = parser.errorfunc
+    parser.errorfunc = _recuperacion(parser, lexer, texto, diagnosticos)
+    lexer.diagnosticos = diagnosticos
     try:
-        resultado = evaluar_expresion(expresion)
-        resultado_label.config(text=f"Resultado: {resultado}", fg="white", bg="#4CAF50")
-    except Exception as e:
-        messagebox.showerror("Error", f"Error al evaluar la expresión: {e}")
+        resultado = parser.parse(texto, lexer=lexer)
+    finally:
+        parser.errorfunc = funcion_error
+        lexer.diagnosticos = None
+    diagnosticos.sort(key=lambda d: (d.linea, d.columna))
+    return resultado, diagnosticos
+
+# === 4. INTERFAZ GRÁFICA DE USUARIO ===
+
+# Tkinter se importa dentro de main() para que el lexer y el parser se puedan usar sin él
+def main():
+    import tkinter as tk
+    from tkinter import messagebox
+
+    from incremental import CalculoIncremental
+
+    # Reutiliza los valores de los grupos entre paréntesis que no cambiaron
+    calculo = CalculoIncremental(parser)
+
+    def on_tecla(evento=None):
+        # Resultado en vivo: los errores se muestran en la etiqueta, sin ventanas emergentes
+        try:
+            resultado, diagnosticos = calculo.actualizar(entry.get())
+        except Exception as e:
+            resultado_label.config(text=str(e), fg="white", bg="#c62828")
+            return
+        if diagnosticos:
+            resultado_label.config(text=str(diagnosticos[0]), fg="white", bg="#c62828")
+        else:
+            resultado_label.config(text=f"Resultado: {resultado}", fg="white", bg="#4CAF50")
+
+    def on_calcular():
+        expresion = entry.get()
+        try:
+            resultado, diagnosticos = calculo.actualizar(expresion)
+            if diagnosticos:
+                messagebox.showerror("Error", "\n".join(map(str, diagnosticos)))
+                return
+            resultado_label.config(text=f"Resultado: {resultado}", fg="white", bg="#4CAF50")
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al evaluar la expresión: {e}")
+
+    # Crear la ventana principal
+    root = tk.Tk()
+    root.title("Calculadora Matemática")
 
-# Crear la ventana principal
-root = tk.Tk()
-root.title("Calculadora Matemática")
+    # Establecer un color de fondo atractivo
+    root.config(bg="#1E2A47")
 
-# Establecer un color de fondo atractivo
-root.config(bg="#1E2A47")
+    # Establecer un tamaño mínimo
+    root.minsize(400, 400)
 
-# Establecer un tamaño mínimo
-root.minsize(400, 400)
+    # Crear el campo de entrada para la expresión
+    entry_label = tk.Label(root, text="Ingresa una expresión matemática:",
+    font=("Arial", 14), fg="#ffffff", bg="#1E2A47")
+    entry_label.pack(pady=10)
 
-# Crear el campo de entrada para la expresión
-entry_label = tk.Label(root, text="Ingresa una expresión matemática:",
-font=("Arial", 14), fg="#ffffff", bg="#1E2A47")
-entry_label.pack(pady=10)
+    entry = tk.Entry(root, width=30, font=("Arial", 16), bd=5, relief="solid", justify="center")
+    entry.pack(pady=10)
+    entry.bind("<KeyRelease>", on_tecla)
 
-entry = tk.Entry(root, width=30, font=("Arial", 16), bd=5, relief="solid", justify="center")
-entry.pack(pady=10)
+    # Botón para calcular la expresión
+    calcular_button = tk.Button(root, text="Calcular", command=on_calcular, font=("Arial", 16),
+                                bg="#4CAF50", fg="white", bd=0, relief="solid", width=15)
+    calcular_button.pack(pady=10)
 
-# Botón para calcular la expresión
-calcular_button = tk.Button(root, text="Calcular", command=on_calcular, font=("Arial", 16),
-                            bg="#4CAF50", fg="white", bd=0, relief="solid", width=15)
-calcular_button.pack(pady=10)
+    # Etiqueta para mostrar el resultado
+    resultado_label = tk.Label(root, text="Resultado: ", font=("Arial", 16), fg="white", bg="#1E2A47")
+    resultado_label.pack(pady=10)
 
-# Etiqueta para mostrar el resultado
-resultado_label = tk.Label(root, text="Resultado: ", font=("Arial", 16), fg="white", bg="#1E2A47")
-resultado_label.pack(pady=10)
+    # Ejecutar la interfaz gráfica
+    root.mainloop()
 
-# Ejecutar la interfaz gráfica
-root.mainloop()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,520 @@
+import argparse
+import ast
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import AnalizadorAST
+import flujo
+import lote
+import optimizador
+import sesion
+
+def medir(funcion, repeticiones):
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return time.perf_counter() - inicio
+
+def reportar(nombre, segundos, operaciones):
+    print(f"{nombre:<28} {segundos:8.3f} s   {operaciones / segundos:14,.0f} ops/s")
+
+# === Caché de expresiones compiladas (AnalizadorAST) ===
+def bench_cache(args):
+    formula = "precio * cantidad - (descuento + impuesto) / 2 * factor + base"
+    variables = {"precio": 10, "cantidad": 3, "descuento": 4, "impuesto": 2, "factor": 5, "base": 1}
+
+    def frio():
+        AnalizadorAST.limpiar_cache()
+        AnalizadorAST.evaluar(formula, variables)
+
+    def caliente():
+        AnalizadorAST.evaluar(formula, variables)
+
+    AnalizadorAST.limpiar_cache()
+    AnalizadorAST.evaluar(formula, variables)
+    reportar("frío (Lexer + Parser)", medir(frio, args.n), args.n)
+    reportar("caliente (caché LRU)", medir(caliente, args.n), args.n)
+    print(AnalizadorAST.info_cache())
+
+# === Lexer carácter a carácter contra LexerRegex ===
+def generar_texto(megabytes):
+    bloque = "resultado = (precio_unitario * 12345 + impuesto) / (cantidad - 7) * factor_2\n"
+    return bloque * (megabytes * 1024 * 1024 // len(bloque))
+
+def generar_texto_variado(megabytes, semilla=1):
+    # Identificadores y números al azar: casi todos los lexemas son distintos,
+    # así la tabla de LexerRegex no puede reutilizar las clasificaciones
+    azar = random.Random(semilla)
+    letras = "abcdefghijklmnopqrstuvwxyz_"
+    separadores = [" + ", " - ", " * ", " / ", " = ", ") * (", "\n", " + ("]
+    partes = []
+    tamano = 0
+    while tamano < megabytes * 1024 * 1024:
+        if azar.random() < 0.5:
+            lexema = azar.choice(letras) + "".join(azar.choices(letras + "0123456789", k=azar.randint(2, 12)))
+        else:
+            lexema = str(azar.randrange(10 ** azar.randint(1, 9)))
+        partes.append(lexema + azar.choice(separadores))
+        tamano += len(partes[-1])
+    return "".join(partes)
+
+def tokenizar(clase_lexer, texto):
+    # iter(funcion, centinela) drena el lexer sin añadir un bucle de Python a la medición
+    lexer = clase_lexer(texto)
+    return list(iter(lexer.get_next_token, (AnalizadorAST.EOF, None)))
+
+def bench_lexer(args):
+    # Una línea repetida favorece a la tabla de lexemas de LexerRegex; el texto
+    # variado mide el caso en que cada lexema se clasifica por primera vez
+    for entrada, texto in (("repetido", generar_texto(args.mb)), ("variado", generar_texto_variado(args.mb))):
+        resultados = {}
+        tiempos = {}
+        for clase in (AnalizadorAST.Lexer, AnalizadorAST.LexerRegex):
+            inicio = time.perf_counter()
+            resultados[clase.__name__] = tokenizar(clase, texto)
+            tiempos[clase.__name__] = time.perf_counter() - inicio
+            reportar(f"{clase.__name__} ({entrada})", tiempos[clase.__name__], len(resultados[clase.__name__]))
+        assert resultados["Lexer"] == resultados["LexerRegex"], "Los lexers produjeron tokens distintos"
+        print(f"{len(texto) / 1e6:.1f} MB, {len(resultados['Lexer']):,} tokens idénticos, "
+              f"LexerRegex {tiempos['Lexer'] / tiempos['LexerRegex']:.1f} veces más rápido")
+
+# === Memoria por token: tuplas, LexToken de PLY y la tabla de tokens.py ===
+# Solo la tabla de tokens.py guarda la posición de cada token; las tuplas de
+# LexerRegex se comparten entre lexemas iguales y no la tienen
+def bench_tokens(args):
+    import analizadorPLY
+    import tokens
+
+    # Solo números y operadores, para que los cuatro lexers acepten el mismo texto
+    bloque = "(125 * 3 + 4) / (7 - 2) * 100 - 42 / 6\n"
+    texto = bloque * (args.mb * 1024 * 1024 // len(bloque))
+
+    def tokens_ply():
+        analizadorPLY.lexer.input(texto)
+        return list(analizadorPLY.lexer)
+
+    variantes = {
+        "Lexer (tuplas)": lambda: tokenizar(AnalizadorAST.Lexer, texto),
+        "LexerRegex (tuplas)": lambda: tokenizar(AnalizadorAST.LexerRegex, texto),
+        "PLY (LexToken)": tokens_ply,
+        "tokens.Tokens (con posición)": lambda: tokens.Tokens(texto),
+    }
+    for nombre, funcion in variantes.items():
+        inicio = time.perf_counter()
+        cantidad = len(funcion())
+        segundos = time.perf_counter() - inicio
+        tracemalloc.start()
+        resultado = funcion()
+        memoria, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del resultado
+        print(f"{nombre:<28} {segundos:8.3f} s   {cantidad / segundos:14,.0f} tokens/s"
+              f"   {memoria / cantidad:6.1f} bytes/token")
+
+# === Flujo por bloques: memoria acotada sin importar el tamaño del archivo ===
+def bench_flujo(args):
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as archivo:
+        ruta = archivo.name
+        archivo.write(generar_texto(args.mb))
+    try:
+        with open(ruta) as archivo:
+            tracemalloc.start()
+            inicio = time.perf_counter()
+            sentencias = sum(1 for _ in flujo.generar_sentencias(archivo))
+            segundos = time.perf_counter() - inicio
+            _, pico = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    finally:
+        os.remove(ruta)
+    reportar("generar_sentencias", segundos, sentencias)
+    print(f"{args.mb} MB en disco, pico de memoria {pico / 1024:,.0f} KiB")
+
+# === Evaluación en lote con varios procesos (analizadorPLY) ===
+def bench_lote(args):
+    bloque = ["(12.5 * 3 + 4) / (7 - 2) * 100 - 42 / 6 + (1 + 2) * (3 + 4) * (5 + 6)"] * 100
+    lineas = bloque * (args.n // len(bloque))
+    base = None
+    procesos = 1
+    while procesos <= args.max_procesos:
+        inicio = time.perf_counter()
+        for _ in lote.evaluar_lineas(lineas, procesos):
+            pass
+        segundos = time.perf_counter() - inicio
+        base = base or segundos
+        reportar(f"{procesos} proceso(s), x{base / segundos:.1f}", segundos, len(lineas))
+        procesos *= 2
+
+# === Diagnósticos: todos los errores de un archivo en una sola pasada ===
+def bench_diagnosticos(args):
+    import io
+
+    # Solo números, que ambos lenguajes aceptan
+    correctas = ["(12 * 3 + 4) / (7 - 2) * 100", "125 / (5 - 3) + 2 * (8 - 1)"]
+    erroneas = ["(12 * + 4 / (7 - 2", "(12 * 3 4) / (7 - ) * 100 $"]
+    lineas = [(erroneas if i % args.cada == 0 else correctas)[i % 2] for i in range(args.n)]
+    texto = "\n".join(lineas) + "\n"
+
+    inicio = time.perf_counter()
+    cantidad = sum(1 for _ in flujo.diagnosticar_lineas(io.StringIO(texto)))
+    reportar(f"AnalizadorAST ({cantidad:,} errores)", time.perf_counter() - inicio, len(lineas))
+
+    inicio = time.perf_counter()
+    cantidad = sum(len(r[1]) for r in lote.evaluar_lineas(lineas, 1, validar=True) if r and not r[0])
+    reportar(f"PLY ({cantidad:,} errores)", time.perf_counter() - inicio, len(lineas))
+
+# === Análisis incremental: una tecla sobre una expresión de decenas de KB ===
+def generar_anidada(profundidad, generador):
+    if profundidad == 0:
+        return generador.choice(["12", "3", "7", "45"])
+    operador = generador.choice(["+", "-", "*"])
+    return f"({generar_anidada(profundidad - 1, generador)} {operador} {generar_anidada(profundidad - 1, generador)})"
+
+# Caracteres de las ediciones al azar: incluyen letras, '=', '.' y espacios
+# que solo acepta uno de los dos lexers, para probar también los diagnósticos
+_ALFABETO_EDICIONES = "0123456789+-*/()=. xyab_\t\n\r"
+
+def _resultado_analisis(funcion, texto):
+    # (resultado, diagnósticos) comparables entre análisis, o la excepción lanzada
+    try:
+        resultado, diagnosticos = funcion(texto)
+    except Exception as e:
+        return type(e).__name__, str(e)
+    if isinstance(resultado, ast.AST):
+        resultado = ast.dump(resultado)
+    return repr(resultado), [str(d) for d in diagnosticos]
+
+def comprobar_ediciones(nombre, analisis, completo, ediciones, generador):
+    # Inserta, borra o cambia un carácter al azar y compara el análisis
+    # incremental con uno completo después de cada edición
+    texto = generar_anidada(3, generador)
+    analisis.actualizar(texto)
+    for _ in range(ediciones):
+        posicion = generador.randrange(len(texto) + 1)
+        operacion = generador.choice("ibc") if 0 < len(texto) < 120 else "b" if texto else "i"
+        caracter = generador.choice(_ALFABETO_EDICIONES)
+        if operacion == "i":
+            texto = texto[:posicion] + caracter + texto[posicion:]
+        elif operacion == "b":
+            texto = texto[:posicion] + texto[posicion + 1:]
+        else:
+            texto = texto[:posicion] + caracter + texto[posicion + 1:]
+        esperado = _resultado_analisis(completo, texto)
+        if _resultado_analisis(analisis.actualizar, texto) != esperado:
+            sys.exit(f"Error: {nombre} incremental no coincide con el análisis completo en {texto!r}")
+    print(f"{nombre:<28} {ediciones} ediciones al azar iguales al análisis completo")
+
+def bench_incremental(args):
+    import analizadorPLY
+    import incremental
+
+    generador = random.Random(1)
+    texto = " + ".join(generar_anidada(6, generador) for _ in range(args.grupos))
+    # Posiciones de dígitos repartidas por el texto: cada "tecla" cambia uno
+    digitos = [i for i, c in enumerate(texto) if c.isdigit()]
+    posiciones = [digitos[generador.randrange(len(digitos))] for _ in range(args.teclas)]
+    print(f"{len(texto) / 1024:.0f} KB, {args.teclas} teclas")
+
+    variantes = (
+        ("AnalizadorAST", incremental.ArbolIncremental(), AnalizadorAST.diagnosticar),
+        ("analizadorPLY", incremental.CalculoIncremental(), analizadorPLY.diagnosticar),
+    )
+    for nombre, analisis, completo in variantes:
+        comprobar_ediciones(nombre, analisis, completo, args.comprobaciones, generador)
+        ediciones = []
+        actual = texto
+        for numero, posicion in enumerate(posiciones):
+            actual = actual[:posicion] + str(numero % 9 + 1) + actual[posicion + 1:]
+            ediciones.append(actual)
+        analisis.actualizar(texto)
+        reportar(f"{nombre} completo", medir(lambda: [completo(e) for e in ediciones[:10]], 1), 10)
+        reportar(f"{nombre} incremental", medir(lambda: [analisis.actualizar(e) for e in ediciones], 1),
+                 len(ediciones))
+
+# === Arranque del parser PLY: yacc.yacc() contra tablas precompiladas ===
+_ARRANQUE = '''
+import time, ply.yacc as yacc, analizadorPLY
+inicio = time.perf_counter()
+{}
+print(time.perf_counter() - inicio)
+'''
+
+def medir_en_proceso_nuevo(codigo):
+    directorio = os.path.dirname(os.path.abspath(__file__))
+    salida = subprocess.run([sys.executable, "-c", _ARRANQUE.format(codigo)], cwd=directorio,
+                            capture_output=True, text=True, check=True)
+    return float(salida.stdout.split()[-1])
+
+def bench_arranque(args):
+    variantes = {
+        "yacc.yacc()": "yacc.yacc(module=analizadorPLY, debug=False, write_tables=False)",
+        "crear_parser() precompilado": "analizadorPLY.crear_parser()",
+    }
+    for nombre, codigo in variantes.items():
+        mejor = min(medir_en_proceso_nuevo(codigo) for _ in range(args.n))
+        print(f"{nombre:<28} {mejor * 1000:8.2f} ms (mejor de {args.n} procesos)")
+
+# === Plegado de constantes e identidades (optimizador) ===
+def generar_formula(terminos, semilla=1):
+    azar = random.Random(semilla)
+    partes = []
+    for i in range(terminos):
+        constante = f"({azar.randint(1, 9)} * {azar.randint(1, 9)} - {azar.randint(1, 9)})"
+        variable = azar.choice(["x", "y", "z"])
+        partes.append(f"({variable} * 1 + {constante} * (2 + 3)) * ({variable} + 0) - {constante} / 4")
+    # Agrupamos por parejas para que la profundidad sea logarítmica (compile() limita la profundidad)
+    while len(partes) > 1:
+        partes = [f"({a}) + ({b})" for a, b in zip(partes[::2], partes[1::2])] + partes[len(partes) // 2 * 2:]
+    return partes[0]
+
+def bench_optimizador(args):
+    formula = generar_formula(args.terminos)
+    tree = AnalizadorAST.Parser(AnalizadorAST.LexerRegex(formula)).parse()
+    original = compile(ast.fix_missing_locations(tree), "<original>", "eval")
+    optimizado = compile(ast.fix_missing_locations(optimizador.optimizar(tree)), "<optimizado>", "eval")
+    variables = {"x": 1.5, "y": -2, "z": 7}
+    assert eval(original, {}, variables) == eval(optimizado, {}, variables)
+    for nombre, codigo in (("árbol original", original), ("árbol optimizado", optimizado)):
+        reportar(nombre, medir(lambda: eval(codigo, {}, variables), args.n), args.n)
+
+# === Evaluación por columnas con NumPy contra un bucle por fila ===
+def bench_vectorizado(args):
+    import numpy as np
+    import vectorizado
+
+    formula = "(precio * cantidad - descuento) / cantidad + precio * 2 - 1"
+    azar = np.random.default_rng(1)
+    columnas = {
+        "precio": azar.uniform(1, 100, args.n),
+        "cantidad": azar.integers(0, 10, args.n),
+        "descuento": azar.uniform(0, 5, args.n),
+    }
+
+    inicio = time.perf_counter()
+    resultado = vectorizado.evaluar_columnas(formula, columnas)
+    reportar("evaluar_columnas (NumPy)", time.perf_counter() - inicio, args.n)
+
+    filas = [dict(zip(columnas, valores)) for valores in zip(*(c.tolist() for c in columnas.values()))]
+    inicio = time.perf_counter()
+    por_fila = []
+    for fila in filas:
+        try:
+            por_fila.append(AnalizadorAST.evaluar(formula, fila))
+        except ZeroDivisionError:
+            por_fila.append(None)
+    reportar("evaluar() fila por fila", time.perf_counter() - inicio, args.n)
+
+    esperado = np.ma.masked_invalid(np.array([np.nan if v is None else v for v in por_fila]))
+    assert np.array_equal(resultado.mask, esperado.mask) and np.ma.allclose(resultado, esperado)
+    print(f"{resultado.mask.sum():,} filas enmascaradas por división entre cero")
+
+# === Sesión: recalcular solo las celdas afectadas por una edición ===
+def bench_sesion(args):
+    lineas = []
+    for i in range(args.celdas):
+        lineas.append(f"v{i} = {i}")
+        lineas.append(f"t{i} = v{i} * 2 + v{max(i - 1, 0)}")
+    programa = "\n".join(lineas)
+
+    hoja = sesion.Sesion()
+    inicio = time.perf_counter()
+    hoja.ejecutar(programa)
+    completo = time.perf_counter() - inicio
+    reportar("programa completo", completo, len(lineas))
+
+    inicio = time.perf_counter()
+    for i in range(args.ediciones):
+        hoja.ejecutar(f"v{(i * 7919) % args.celdas} = {i}")
+    segundos = time.perf_counter() - inicio
+    reportar("ediciones incrementales", segundos, args.ediciones)
+    print(f"última edición: {hoja.recalculadas} de {len(lineas)} celdas recalculadas; "
+          f"{completo / (segundos / args.ediciones):,.0f}x más rápido que reejecutar todo")
+
+# === Paréntesis anidados: Parser recursivo contra ParserIterativo ===
+def bench_profundidad(args):
+    for profundidad in (100, 500, args.profundidad):
+        texto = "(" * profundidad + "x + 1" + ") * 2" * profundidad
+        variantes = (
+            ("Parser", lambda: AnalizadorAST.Parser(AnalizadorAST.LexerRegex(texto)).parse()),
+            ("ParserIterativo", lambda: AnalizadorAST.ParserIterativo(AnalizadorAST.LexerRegex(texto)).parse()),
+            ("diagnosticar", lambda: AnalizadorAST.diagnosticar(texto)),
+        )
+        for variante, funcion in variantes:
+            nombre = f"{variante} ({profundidad})"
+            try:
+                segundos = medir(funcion, args.n)
+            except RecursionError:
+                print(f"{nombre:<28} RecursionError")
+                continue
+            reportar(nombre, segundos, args.n)
+
+# === Vista del árbol: primera pintura sin depender del tamaño ===
+def bench_vista(args):
+    from vista_arbol import VistaArbol
+
+    def pico(funcion):
+        tracemalloc.start()
+        try:
+            inicio = time.perf_counter()
+            funcion()
+            segundos = time.perf_counter() - inicio
+            _, maximo = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return segundos, maximo
+
+    for terminos in (100, 1_000, args.terminos):
+        texto = " + ".join(["(a * 2 - b)"] * terminos)
+        tree = AnalizadorAST.ParserIterativo(AnalizadorAST.LexerRegex(texto)).parse()
+        variantes = (
+            ("VistaArbol", lambda: VistaArbol(tree).lineas(0, 20)),
+            ("ast.dump", lambda: ast.dump(tree, indent=4).split("\n", 20)[:20]),
+        )
+        for nombre, funcion in variantes:
+            nombre = f"{nombre} ({terminos})"
+            try:
+                segundos, maximo = pico(funcion)
+            except RecursionError:
+                print(f"{nombre:<28} RecursionError")
+                continue
+            print(f"{nombre:<28} {segundos * 1000:8.3f} ms   {maximo / 1024:10,.1f} KB de pico")
+
+# === Tipos numéricos del parser PLY: float, Decimal y Fraction ===
+def bench_numeros(args):
+    import analizadorPLY
+    from decimal import Decimal
+
+    lineas = ["(12.5 * 3 + 4) / (7 - 2) * 100 - 42.25 / 6 + (1.1 + 2) * (3 + 4) * (5 + 6)",
+              "0.1 + 0.2 - 0.3 * (19.99 - 4.01) / 3"] * (args.n // 2)
+    for nombre, numero in analizadorPLY.NUMEROS.items():
+        parser = analizadorPLY.crear_parser(numero)
+        segundos = medir(lambda: [parser.parse(linea, lexer=analizadorPLY.lexer) for linea in lineas], 1)
+        reportar(nombre, segundos, len(lineas))
+
+    # Lo que había que hacer antes: calcular en float y convertir al final (y con error de redondeo)
+    parser = analizadorPLY.parser
+    segundos = medir(lambda: [Decimal(repr(parser.parse(linea, lexer=analizadorPLY.lexer)))
+                              for linea in lineas], 1)
+    reportar("float y luego Decimal", segundos, len(lineas))
+
+# === Importación del núcleo sin Tkinter (python -X importtime) ===
+MODULOS_NUCLEO = ["tokens", "AnalizadorAST", "optimizador", "flujo", "sesion", "lote", "analizadorPLY", "incremental",
+                  "vista_arbol"]
+
+def tiempos_de_importacion(modulos, directorio):
+    # Devuelve {módulo: microsegundos acumulados} de un intérprete nuevo con -X importtime
+    codigo = "import " + ", ".join(modulos)
+    salida = subprocess.run([sys.executable, "-X", "importtime", "-c", codigo], cwd=directorio,
+                            capture_output=True, text=True, check=True)
+    tiempos = {}
+    for linea in salida.stderr.splitlines():
+        if not linea.startswith("import time:") or linea.endswith("imported package"):
+            continue
+        _, acumulado, nombre = linea[len("import time:"):].split("|")
+        tiempos[nombre.strip()] = (int(acumulado), nombre.startswith("  "))
+    return tiempos
+
+def bench_importacion(args):
+    directorio = os.path.dirname(os.path.abspath(__file__))
+    tiempos_de_importacion(MODULOS_NUCLEO, directorio)  # El primer intento genera los .pyc
+    tiempos = tiempos_de_importacion(MODULOS_NUCLEO, directorio)
+    total = sum(microsegundos for nombre, (microsegundos, anidado) in tiempos.items()
+                if nombre in MODULOS_NUCLEO and not anidado)
+    for modulo in MODULOS_NUCLEO:
+        print(f"{modulo:<28} {tiempos[modulo][0] / 1000:8.2f} ms")
+    print(f"{'total':<28} {total / 1000:8.2f} ms (presupuesto {args.presupuesto} ms)")
+
+    errores = [f"se importó {nombre}" for nombre in tiempos if nombre.split(".")[0] in ("tkinter", "_tkinter")]
+    if total / 1000 > args.presupuesto:
+        errores.append("se superó el presupuesto de tiempo")
+    for error in errores:
+        print(f"Error: {error}")
+    if errores:
+        sys.exit(1)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de los analizadores.")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    cache = subparsers.add_parser("cache", help="Evaluación en frío contra evaluación con caché.")
+    cache.add_argument("-n", type=int, default=100_000, help="Número de evaluaciones.")
+    cache.set_defaults(funcion=bench_cache)
+
+    lexer = subparsers.add_parser("lexer", help="Lexer original contra LexerRegex.")
+    lexer.add_argument("--mb", type=int, default=4, help="Tamaño de la entrada en megabytes.")
+    lexer.set_defaults(funcion=bench_lexer)
+
+    fichas = subparsers.add_parser("tokens", help="Memoria por token de cada representación.")
+    fichas.add_argument("--mb", type=int, default=4, help="Tamaño del texto en megabytes.")
+    fichas.set_defaults(funcion=bench_tokens)
+
+    streaming = subparsers.add_parser("flujo", help="Sentencias desde un archivo leído por bloques.")
+    streaming.add_argument("--mb", type=int, default=4, help="Tamaño del archivo en megabytes.")
+    streaming.set_defaults(funcion=bench_flujo)
+
+    por_lotes = subparsers.add_parser("lote", help="Escalado de lote.py con el número de procesos.")
+    por_lotes.add_argument("-n", type=int, default=200_000, help="Número de expresiones.")
+    por_lotes.add_argument("--max-procesos", type=int, default=os.cpu_count(), help="Máximo de procesos.")
+    por_lotes.set_defaults(funcion=bench_lote)
+
+    diagnosticos = subparsers.add_parser("diagnosticos", help="Todos los errores de sintaxis en una pasada.")
+    diagnosticos.add_argument("-n", type=int, default=100_000, help="Número de líneas.")
+    diagnosticos.add_argument("--cada", type=int, default=10, help="Una línea errónea cada tantas.")
+    diagnosticos.set_defaults(funcion=bench_diagnosticos)
+
+    incremental = subparsers.add_parser("incremental", help="Reanálisis en cada tecla contra análisis completo.")
+    incremental.add_argument("--grupos", type=int, default=200, help="Grupos de primer nivel de la expresión.")
+    incremental.add_argument("--teclas", type=int, default=500, help="Ediciones a simular.")
+    incremental.add_argument("--comprobaciones", type=int, default=300,
+                             help="Ediciones al azar que se comparan con un análisis completo.")
+    incremental.set_defaults(funcion=bench_incremental)
+
+    arranque = subparsers.add_parser("arranque", help="Tiempo de construcción del parser PLY.")
+    arranque.add_argument("-n", type=int, default=5, help="Procesos nuevos por variante.")
+    arranque.set_defaults(funcion=bench_arranque)
+
+    optimizacion = subparsers.add_parser("optimizador", help="Evaluación del árbol original contra el optimizado.")
+    optimizacion.add_argument("-n", type=int, default=2_000, help="Número de evaluaciones.")
+    optimizacion.add_argument("--terminos", type=int, default=200, help="Términos de la fórmula generada.")
+    optimizacion.set_defaults(funcion=bench_optimizador)
+
+    vector = subparsers.add_parser("vectorizado", help="NumPy por columnas contra un bucle por fila.")
+    vector.add_argument("-n", type=int, default=1_000_000, help="Número de filas.")
+    vector.set_defaults(funcion=bench_vectorizado)
+
+    hoja = subparsers.add_parser("sesion", help="Ediciones incrementales en una Sesion con miles de celdas.")
+    hoja.add_argument("--celdas", type=int, default=5_000, help="Número de celdas de entrada.")
+    hoja.add_argument("--ediciones", type=int, default=1_000, help="Número de ediciones.")
+    hoja.set_defaults(funcion=bench_sesion)
+
+    profundidad = subparsers.add_parser("profundidad", help="Parser recursivo contra ParserIterativo.")
+    profundidad.add_argument("-n", type=int, default=20, help="Repeticiones por profundidad.")
+    profundidad.add_argument("--profundidad", type=int, default=20_000, help="Anidamiento máximo.")
+    profundidad.set_defaults(funcion=bench_profundidad)
+
+    vista = subparsers.add_parser("vista", help="Primera pintura del árbol: ast.dump contra VistaArbol.")
+    vista.add_argument("--terminos", type=int, default=100_000, help="Términos de la expresión más grande.")
+    vista.set_defaults(funcion=bench_vista)
+
+    numeros = subparsers.add_parser("numeros", help="Parser PLY con float, Decimal y Fraction.")
+    numeros.add_argument("-n", type=int, default=100_000, help="Número de expresiones.")
+    numeros.set_defaults(funcion=bench_numeros)
+
+    importacion = subparsers.add_parser("importacion", help="Verifica que el núcleo cargue sin Tkinter y a tiempo.")
+    importacion.add_argument("--presupuesto", type=float, default=150, help="Tiempo máximo en milisegundos.")
+    importacion.set_defaults(funcion=bench_importacion)
+
+    args = parser.parse_args()
+    args.funcion(args)
+
+if __name__ == "__main__":
+    main()
+
+#¿Cómo ejecutar?
+#python benchmarks.py <benchmark> [-n N]
+#Ejemplo:
+# python benchmarks.py cache -n 50000
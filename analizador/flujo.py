@@ -0,0 +1,116 @@
+from AnalizadorAST import EOF, LexerRegex, ParserIterativo, diagnosticar
+from tokens import NEWLINE
+
+# === Lectura por bloques ===
+TAMANO_BLOQUE = 1 << 16
+
+def leer_bloques(archivo, tamano_bloque=TAMANO_BLOQUE):
+    while True:
+        bloque = archivo.read(tamano_bloque)
+        if not bloque:
+            return
+        yield bloque
+
+def _continua_token(caracter):
+    # Solo números e identificadores ocupan más de un carácter; el punto cubre
+    # los decimales del lexer de PLY
+    return caracter.isalnum() or caracter in '_.'
+
+def segmentos(archivo, tamano_bloque=TAMANO_BLOQUE):
+    # Bloques recortados donde ningún token puede quedar partido: lo que queda
+    # del último token se guarda y se antepone al siguiente bloque
+    pendiente = ''
+    for bloque in leer_bloques(archivo, tamano_bloque):
+        texto = pendiente + bloque if pendiente else bloque
+        corte = len(texto)
+        while corte and _continua_token(texto[corte - 1]):
+            corte -= 1
+        pendiente = texto[corte:]
+        if corte:
+            yield texto[:corte]
+    if pendiente:
+        yield pendiente
+
+def leer_lineas(archivo, tamano_bloque=TAMANO_BLOQUE):
+    partes = []
+    for bloque in leer_bloques(archivo, tamano_bloque):
+        if '\n' not in bloque:
+            partes.append(bloque)
+            continue
+        lineas = bloque.split('\n')
+        partes.append(lineas[0])
+        lineas[0] = ''.join(partes)
+        partes = [lineas.pop()]
+        yield from lineas
+    resto = ''.join(partes)
+    if resto:
+        yield resto
+
+# === Flujo para AnalizadorAST ===
+def generar_tokens(archivo, tamano_bloque=TAMANO_BLOQUE):
+    # Los mismos tokens de LexerRegex, más (NEWLINE, '\n') al final de cada línea
+    fin = (EOF, None)
+    salto = (NEWLINE, '\n')
+    for segmento in segmentos(archivo, tamano_bloque):
+        lineas = segmento.split('\n')
+        yield from iter(LexerRegex(lineas[0]).get_next_token, fin)
+        for linea in lineas[1:]:
+            yield salto
+            yield from iter(LexerRegex(linea).get_next_token, fin)
+
+class _LexerSentencia:
+    # Entrega los tokens de una sola línea y luego EOF, sin tocar la siguiente
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.terminada = False
+        self.agotado = False
+
+    def get_next_token(self):
+        if not self.terminada:
+            token = next(self.tokens, None)
+            if token is None:
+                self.agotado = True
+            elif token[0] != NEWLINE:
+                return token
+            self.terminada = True
+        return (EOF, None)
+
+def generar_sentencias(archivo, tamano_bloque=TAMANO_BLOQUE):
+    # Produce (número de línea, ast.Expression) por cada línea no vacía
+    tokens = generar_tokens(archivo, tamano_bloque)
+    numero = 0
+    while True:
+        numero += 1
+        lexer = _LexerSentencia(tokens)
+        try:
+            parser = ParserIterativo(lexer)
+            if parser.current_token[0] != EOF:
+                tree = parser.parse()
+                parser.eat(EOF)
+                yield numero, tree
+        except Exception as e:
+            raise Exception(f'Línea {numero}: {e}') from e
+        if lexer.agotado:
+            return
+
+def diagnosticar_lineas(archivo, tamano_bloque=TAMANO_BLOQUE):
+    # Una sola pasada por el archivo: produce un Diagnostico por cada error de
+    # cada línea, con la línea del archivo, sin detenerse en el primero
+    for numero, linea in enumerate(leer_lineas(archivo, tamano_bloque), 1):
+        if linea.strip():
+            for diagnostico in diagnosticar(linea)[1]:
+                diagnostico.linea = numero
+                yield diagnostico
+
+# === Flujo para el lexer y el parser de PLY ===
+def generar_tokens_ply(archivo, lexer, tamano_bloque=TAMANO_BLOQUE):
+    # lexpos y lineno de cada LexToken son relativos a su segmento
+    for segmento in segmentos(archivo, tamano_bloque):
+        lexer.input(segmento)
+        yield from lexer
+
+def evaluar_lineas_ply(archivo, parser, lexer, tamano_bloque=TAMANO_BLOQUE):
+    # Produce (número de línea, resultado) por cada línea no vacía
+    for numero, linea in enumerate(leer_lineas(archivo, tamano_bloque), 1):
+        if linea.strip():
+            yield numero, parser.parse(linea, lexer=lexer)
@@ -0,0 +1,259 @@
+from array import array
+from bisect import bisect_left
+
+from AnalizadorAST import Parser, diagnosticar
+from tokens import EOF, INVALIDO, LPAREN, NUMBER, RPAREN, Clasificacion, ClasificacionPLY, Token, lexemas
+
+# === Tokens que se actualizan por regiones ===
+def _prefijo_comun(a, b):
+    # Búsqueda binaria comparando cortes: cada comparación se hace en C
+    bajo, alto = 0, min(len(a), len(b))
+    while bajo < alto:
+        medio = (bajo + alto + 1) // 2
+        if a[:medio] == b[:medio]:
+            bajo = medio
+        else:
+            alto = medio - 1
+    return bajo
+
+def _sufijo_comun(a, b, limite):
+    bajo, alto = 0, limite
+    while bajo < alto:
+        medio = (bajo + alto + 1) // 2
+        if a[len(a) - medio:] == b[len(b) - medio:]:
+            bajo = medio
+        else:
+            alto = medio - 1
+    return bajo
+
+class TokensIncrementales:
+    # Tokens del último texto, en arreglos como tokens.Tokens más el final de
+    # cada uno. Al cambiar el texto solo se vuelve a tokenizar la región dañada:
+    # desde el token que toca el primer carácter distinto hasta que un token
+    # nuevo empieza donde empezaba uno viejo, pasado el último carácter distinto
+    def __init__(self, clasificacion=None):
+        self.texto = ''
+        self.tipos = array('B')
+        self.valores = []
+        self.inicios = array('I')
+        self.finales = array('I')
+        self.relexados = 0
+        self._clasificacion = clasificacion if clasificacion is not None else Clasificacion()
+
+    def __len__(self):
+        return len(self.tipos)
+
+    def actualizar(self, texto):
+        # Devuelve (a, r, k): los tokens viejos [a, k) se reemplazaron por los r nuevos desde a
+        viejo = self.texto
+        prefijo = _prefijo_comun(viejo, texto)
+        sufijo = _sufijo_comun(viejo, texto, min(len(viejo), len(texto)) - prefijo)
+        fin_danado = len(texto) - sufijo
+        delta = len(texto) - len(viejo)
+
+        total = len(self.tipos)
+        a = bisect_left(self.finales, prefijo)  # Un token que termina justo ahí podría alargarse
+        inicio = min(prefijo, self.inicios[a]) if a < total else prefijo
+
+        tipos, valores, inicios, finales = array('B'), [], array('I'), array('I')
+        k = total
+        for posicion, fin, tipo, valor in lexemas(texto, inicio, self._clasificacion):
+            if posicion >= fin_danado:
+                # A partir de aquí el texto es el mismo que antes: si un token viejo
+                # empezaba en esta posición, el resto de la tokenización coincide
+                j = bisect_left(self.inicios, posicion - delta, a)
+                if j < total and self.inicios[j] == posicion - delta:
+                    k = j
+                    break
+            tipos.append(tipo)
+            valores.append(valor)
+            inicios.append(posicion)
+            finales.append(fin)
+
+        self.tipos[a:k] = tipos
+        self.valores[a:k] = valores
+        resto = a + len(tipos)
+        self.inicios = self.inicios[:a] + inicios + array('I', map(delta.__add__, self.inicios[k:]))
+        self.finales = self.finales[:a] + finales + array('I', map(delta.__add__, self.finales[k:]))
+        self.texto = texto
+        self.relexados = len(tipos)
+        return a, resto - a, k
+
+# === Análisis por grupos entre paréntesis ===
+class Grupo:
+    # Resultado de un grupo entre paréntesis (o de la expresión completa) y
+    # de sus grupos hijos, indexados por su distancia en tokens al '(' del padre.
+    # Las distancias no cambian cuando el grupo se desplaza dentro del texto
+    __slots__ = ('longitud', 'resultado', 'hijos')
+
+    def __init__(self, longitud, resultado, hijos):
+        self.longitud = longitud
+        self.resultado = resultado
+        self.hijos = hijos
+
+class AnalisisIncremental:
+    # Lo que hay entre un '(' y su ')' se analiza igual esté donde esté, así que
+    # un grupo que la edición no tocó conserva su resultado; solo se vuelven a
+    # analizar los grupos que encierran la región dañada. Las subclases dicen
+    # cómo se representa un token o un grupo ya resuelto y cómo se resuelve
+    # una lista de elementos
+    clasificacion = Clasificacion  # Cómo se clasifica cada lexema
+
+    def __init__(self):
+        self.tokens = TokensIncrementales(self.clasificacion())
+        self.raiz = None
+        self.reanalizados = 0  # Grupos analizados de nuevo en la última actualización
+
+    def actualizar(self, texto):
+        # Devuelve (resultado, lista de Diagnostico), como diagnosticar()
+        a, r, k = self.tokens.actualizar(texto)
+        try:
+            self.raiz = self._analizar(a, r, k)
+        except Exception:
+            # Con errores no hay nada que reutilizar: el análisis completo da los diagnósticos
+            self.raiz = None
+            return self._analizar_completo(texto)
+        return self.raiz.resultado, []
+
+    def _analizar(self, a, r, k):
+        desplazamiento = a + r - k
+        tipos = self.tokens.tipos
+        total = len(tipos)
+        self.reanalizados = 0
+
+        def indice_viejo(j):
+            if j < a:
+                return j
+            if j >= a + r:
+                return j - desplazamiento
+            return None
+
+        # Cada marco: [inicio, inicio viejo, grupo viejo, elementos, hijos nuevos]
+        marcos = [[0, 0, self.raiz, [], {}]]
+        j = 0
+        while j < total:
+            tipo = tipos[j]
+            marco = marcos[-1]
+            if tipo == LPAREN:
+                viejo = indice_viejo(j)
+                anterior = None
+                if marco[2] is not None and viejo is not None and marco[1] is not None:
+                    anterior = marco[2].hijos.get(viejo - marco[1])
+                if anterior is not None and (viejo + anterior.longitud <= a or viejo >= k):
+                    # Grupo intacto: se reutiliza sin mirar sus tokens
+                    marco[3].append(self._elemento_grupo(j, anterior))
+                    marco[4][j - marco[0]] = anterior
+                    j += anterior.longitud
+                    continue
+                marcos.append([j, viejo, anterior, [], {}])
+            elif tipo == RPAREN:
+                if len(marcos) == 1:
+                    raise SyntaxError('Paréntesis de cierre sin abrir')
+                marcos.pop()
+                grupo = Grupo(j - marco[0] + 1, self._resolver(marco[3], False), marco[4])
+                self.reanalizados += 1
+                padre = marcos[-1]
+                padre[3].append(self._elemento_grupo(marco[0], grupo))
+                padre[4][marco[0] - padre[0]] = grupo
+            else:
+                marco[3].append(self._elemento_token(j))
+            j += 1
+
+        if len(marcos) > 1:
+            raise SyntaxError('Paréntesis sin cerrar')
+        self.reanalizados += 1
+        return Grupo(total, self._resolver(marcos[0][3], True), marcos[0][4])
+
+# === AnalizadorAST: árboles ===
+_NODO = -1  # Elemento que ya es un nodo del árbol (un grupo resuelto)
+
+class _LexerElementos:
+    def __init__(self, elementos):
+        self.siguiente = iter(elementos).__next__
+
+    def get_next_token(self):
+        try:
+            return self.siguiente()
+        except StopIteration:
+            return (EOF, None)
+
+class _ParserElementos(Parser):
+    # Parser sobre una lista de elementos donde los grupos ya son nodos
+    def factor(self):
+        if self.current_token[0] == _NODO:
+            node = self.current_token[1]
+            self.eat(_NODO)
+            return node
+        return super().factor()
+
+class ArbolIncremental(AnalisisIncremental):
+    # Mismos árboles que diagnosticar(texto), reutilizando los subárboles de
+    # los grupos que no cambiaron
+    def _elemento_token(self, j):
+        tipo, valor = self.tokens.tipos[j], self.tokens.valores[j]
+        if tipo == NUMBER and valor.__class__ is str:
+            # Un decimal no es válido en esta gramática: el análisis completo lo diagnostica
+            raise SyntaxError('Número decimal')
+        return (tipo, valor)
+
+    def _elemento_grupo(self, j, grupo):
+        return (_NODO, grupo.resultado)
+
+    def _resolver(self, elementos, raiz):
+        parser = _ParserElementos(_LexerElementos(elementos))
+        node = parser.parse() if raiz else parser.expr()
+        if parser.current_token[0] != EOF:
+            raise SyntaxError('Sobran tokens')
+        return node
+
+    def _analizar_completo(self, texto):
+        return diagnosticar(texto)
+
+# === analizadorPLY: valores ===
+class _LexerLista:
+    def __init__(self, elementos):
+        self.siguiente = iter(elementos).__next__
+
+    def token(self):
+        try:
+            return self.siguiente()
+        except StopIteration:
+            return None
+
+class CalculoIncremental(AnalisisIncremental):
+    # Mismos resultados que analizadorPLY.diagnosticar(texto): un grupo intacto
+    # llega al parser de PLY como un solo NUMBER con su valor ya calculado,
+    # que la gramática reduce igual que a '( expression )'. Los lexemas que el
+    # lexer de PLY no acepta (letras, espacios raros) van al análisis completo,
+    # que usa ese mismo lexer y da sus diagnósticos carácter por carácter
+    clasificacion = ClasificacionPLY
+
+    def __init__(self, parser=None):
+        super().__init__()
+        import analizadorPLY
+        self._analizadorPLY = analizadorPLY
+        self.parser = parser or analizadorPLY.parser
+        self.lexer = analizadorPLY.lexer.clone()
+
+    def _elemento_token(self, j):
+        tokens = self.tokens
+        if tokens.tipos[j] == INVALIDO:
+            raise SyntaxError('Carácter no válido')
+        return Token(tokens.tipos[j], tokens.valores[j], 0, 0, tokens.inicios[j])
+
+    def _elemento_grupo(self, j, grupo):
+        return Token(NUMBER, grupo.resultado, 0, 0, self.tokens.inicios[j])
+
+    def _resolver(self, elementos, raiz):
+        funcion_error = self.parser.errorfunc
+        self.parser.errorfunc = _error_sintaxis
+        try:
+            return self.parser.parse(lexer=_LexerLista(elementos))
+        finally:
+            self.parser.errorfunc = funcion_error
+
+    def _analizar_completo(self, texto):
+        return self._analizadorPLY.diagnosticar(texto, self.parser, self.lexer)
+
+def _error_sintaxis(t):
+    raise SyntaxError('Error de sintaxis')
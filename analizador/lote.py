@@ -0,0 +1,125 @@
+import argparse
+import contextlib
+import os
+import sys
+from collections import deque
+from itertools import islice
+
+import flujo
+
+# Cada proceso trabajador construye su lexer y su parser de PLY una sola vez
+_lexer = None
+_parser = None
+_diagnosticar = None
+
+def _iniciar_trabajador(numeros='float'):
+    global _lexer, _parser, _diagnosticar
+    import analizadorPLY
+    _lexer = analizadorPLY.lexer
+    if numeros == 'float':
+        _parser = analizadorPLY.parser  # Importar analizadorPLY ya lo construyó
+    else:
+        _parser = analizadorPLY.crear_parser(analizadorPLY.NUMEROS[numeros])
+    _diagnosticar = analizadorPLY.diagnosticar
+
+def evaluar_bloque(lineas, validar=False):
+    # Devuelve (True, resultado) o (False, mensaje) por cada línea, en orden.
+    # Con validar, los errores de sintaxis no detienen la línea: se devuelve
+    # (False, lista de Diagnostico) con todos los que tenga
+    if _parser is None:
+        _iniciar_trabajador()
+    resultados = []
+    # Los avisos de t_error van a stderr para no mezclarse con los resultados
+    with contextlib.redirect_stdout(sys.stderr):
+        for linea in lineas:
+            if not linea.strip():
+                resultados.append(None)
+                continue
+            try:
+                if validar:
+                    resultado, diagnosticos = _diagnosticar(linea, _parser, _lexer)
+                    resultados.append((False, diagnosticos) if diagnosticos else (True, resultado))
+                else:
+                    resultados.append((True, _parser.parse(linea, lexer=_lexer)))
+            except Exception as e:
+                resultados.append((False, str(e)))
+    return resultados
+
+def dividir_en_bloques(lineas, tamano_bloque):
+    lineas = iter(lineas)
+    while True:
+        bloque = list(islice(lineas, tamano_bloque))
+        if not bloque:
+            return
+        yield bloque
+
+def evaluar_lineas(lineas, procesos=None, tamano_bloque=1000, numeros='float', validar=False):
+    # Resultados en el mismo orden de la entrada; como mucho 2 bloques por
+    # proceso quedan pendientes, así la memoria no depende del tamaño de la entrada
+    bloques = dividir_en_bloques(lineas, tamano_bloque)
+    if procesos == 1:
+        _iniciar_trabajador(numeros)
+        for bloque in bloques:
+            yield from evaluar_bloque(bloque, validar)
+        return
+
+    # Se importa aquí: cargar multiprocessing es caro y el modo de un proceso no lo necesita
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_trabajador,
+                             initargs=(numeros,)) as pool:
+        pendientes = deque()
+        limite = 2 * (procesos or os.cpu_count() or 1)
+        for bloque in bloques:
+            pendientes.append(pool.submit(evaluar_bloque, bloque, validar))
+            if len(pendientes) >= limite:
+                yield from pendientes.popleft().result()
+        while pendientes:
+            yield from pendientes.popleft().result()
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Evalúa en lote expresiones de la calculadora PLY, una por línea."
+    )
+    parser.add_argument("archivo", nargs="?", help="Archivo de expresiones (por defecto, stdin).")
+    parser.add_argument("-j", "--procesos", type=int, default=None,
+                        help="Número de procesos (por defecto, uno por núcleo).")
+    parser.add_argument("-b", "--bloque", type=int, default=1000,
+                        help="Líneas por bloque enviado a cada proceso.")
+    parser.add_argument("-n", "--numeros", choices=["float", "decimal", "fraccion"], default="float",
+                        help="Tipo numérico de los resultados.")
+    parser.add_argument("-v", "--validar", action="store_true",
+                        help="Informar todos los errores de sintaxis de cada línea, con su columna.")
+
+    args = parser.parse_args()
+
+    entrada = open(args.archivo) if args.archivo else sys.stdin
+    errores = 0
+    with entrada:
+        lineas = flujo.leer_lineas(entrada)
+        for numero, resultado in enumerate(evaluar_lineas(lineas, args.procesos, args.bloque, args.numeros, args.validar), 1):
+            if resultado is None:
+                print()
+            elif resultado[0]:
+                print(resultado[1])
+            elif isinstance(resultado[1], list):
+                errores += len(resultado[1])
+                for diagnostico in resultado[1]:
+                    diagnostico.linea = numero
+                    print(diagnostico)
+            else:
+                errores += 1
+                print(f"Línea {numero}: {resultado[1]}")
+    if errores:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
+
+#¿Cómo ejecutar?
+#python lote.py [archivo] [-j PROCESOS] [-b LINEAS_POR_BLOQUE] [-n float|decimal|fraccion] [-v]
+#Ejemplo:
+# python lote.py expresiones.txt -j 4
+# python lote.py expresiones.txt -n decimal
+# python lote.py expresiones.txt -v
+# type expresiones.txt | python lote.py
@@ -0,0 +1,86 @@
+import ast
+import operator
+
+# === Optimizador del árbol de AnalizadorAST ===
+_OPERACIONES = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+
+def _es_entero(node, valor):
+    # Solo constantes int: x * 1.0 convertiría un entero en float
+    return isinstance(node, ast.Constant) and type(node.value) is int and node.value == valor
+
+def _solo_enteros(node):
+    # Sin divisiones ni constantes que no sean int: con variables enteras, el
+    # subárbol da un int. Las divisiones ya plegadas quedan como constantes float
+    for n in ast.walk(node):
+        if isinstance(n, ast.BinOp) and isinstance(n.op, ast.Div):
+            return False
+        if isinstance(n, ast.Constant) and type(n.value) is not int:
+            return False
+    return True
+
+class Optimizador(ast.NodeTransformer):
+    # Pliega subárboles constantes y aplica identidades seguras.
+    # x * 0 -> 0 solo se aplica con solo_enteros=True (con floats, inf * 0 es nan)
+    # y solo si x da un int: sin divisiones (podrían fallar o dar float) ni
+    # constantes float, que darían 0.0 o -0.0 en lugar de 0. Por lo mismo,
+    # x + 0 -> x (-0.0 + 0 es 0.0) exige que x dé un int; x - 0 -> x es exacto.
+    def __init__(self, solo_enteros=False):
+        self.solo_enteros = solo_enteros
+
+    def visit_BinOp(self, node):
+        # Recorrido en postorden con pila explícita: las cadenas largas como
+        # a + b + c + ... no consumen la pila de Python
+        pila = [(node, False)]
+        resultados = []
+        while pila:
+            actual, hijos_listos = pila.pop()
+            if not isinstance(actual, ast.BinOp):
+                resultados.append(self.visit(actual))
+            elif hijos_listos:
+                actual.right = resultados.pop()
+                actual.left = resultados.pop()
+                resultados.append(self._simplificar(actual))
+            else:
+                pila.append((actual, True))
+                pila.append((actual.right, False))
+                pila.append((actual.left, False))
+        return resultados[0]
+
+    def _simplificar(self, node):
+        left, right, op = node.left, node.right, type(node.op)
+
+        if isinstance(left, ast.Constant) and isinstance(right, ast.Constant):
+            try:
+                return ast.Constant(value=_OPERACIONES[op](left.value, right.value))
+            except ZeroDivisionError:
+                pass  # Se deja sin plegar para que el error ocurra al evaluar
+
+        if op is ast.Add:
+            if self.solo_enteros:
+                if _es_entero(right, 0) and _solo_enteros(left):
+                    return left
+                if _es_entero(left, 0) and _solo_enteros(right):
+                    return right
+        elif op is ast.Sub:
+            if _es_entero(right, 0):
+                return left
+        elif op is ast.Mult:
+            if _es_entero(right, 1):
+                return left
+            if _es_entero(left, 1):
+                return right
+            if self.solo_enteros:
+                if _es_entero(right, 0) and _solo_enteros(left):
+                    return right
+                if _es_entero(left, 0) and _solo_enteros(right):
+                    return left
+
+        return node
+
+def optimizar(tree, solo_enteros=False):
+    return Optimizador(solo_enteros).visit(tree)
@@ -0,0 +1,123 @@
+import ast
+from collections import deque
+
+from AnalizadorAST import EOF, LexerRegex, ParserIterativo
+from optimizador import optimizar
+
+_GLOBALES = {"__builtins__": {}}
+
+# === Programas de varias sentencias ===
+def parsear_programa(texto):
+    # Una sentencia por línea: asignaciones (ast.Assign) o expresiones (ast.Expr)
+    sentencias = []
+    for numero, linea in enumerate(texto.splitlines(), 1):
+        if not linea.strip():
+            continue
+        try:
+            parser = ParserIterativo(LexerRegex(linea))
+            nodo = parser.parse().body
+            parser.eat(EOF)
+        except Exception as e:
+            raise Exception(f'Línea {numero}: {e}') from e
+        sentencias.append(nodo if isinstance(nodo, ast.Assign) else ast.Expr(value=nodo))
+    return ast.fix_missing_locations(ast.Module(body=sentencias, type_ignores=[]))
+
+def _compilar(valor):
+    tree = ast.fix_missing_locations(ast.Expression(body=optimizar(valor)))
+    return compile(tree, '<sesion>', 'eval')
+
+# === Sesión con entorno persistente ===
+class Sesion:
+    # Cada asignación es una celda: se recuerda su código y de qué variables
+    # depende, y al redefinirla solo se recalculan las celdas que dependen de
+    # ella (y solo si alguna de sus entradas cambió de verdad)
+    def __init__(self):
+        self.variables = {}
+        self.errores = {}
+        self.recalculadas = 0
+        self._celdas = {}
+        self._dependientes = {}
+
+    def ejecutar(self, texto):
+        # Devuelve el valor de cada sentencia que es una expresión
+        resultados = []
+        for sentencia in parsear_programa(texto).body:
+            if isinstance(sentencia, ast.Assign):
+                self.definir(sentencia.targets[0].id, sentencia.value)
+            else:
+                resultados.append(eval(_compilar(sentencia.value), _GLOBALES, self.variables))
+        return resultados
+
+    def definir(self, nombre, valor):
+        dependencias = {n.id for n in ast.walk(valor) if isinstance(n, ast.Name)}
+        if self._alcanza(dependencias, nombre):
+            raise Exception(f'Referencia circular en {nombre}')
+
+        anterior = self._celdas.get(nombre)
+        if anterior is not None:
+            for dependencia in anterior[1]:
+                self._dependientes[dependencia].discard(nombre)
+        for dependencia in dependencias:
+            self._dependientes.setdefault(dependencia, set()).add(nombre)
+        self._celdas[nombre] = (_compilar(valor), dependencias)
+        self._recalcular(nombre)
+
+    def _alcanza(self, inicio, objetivo):
+        vistos = set()
+        pendientes = list(inicio)
+        while pendientes:
+            nombre = pendientes.pop()
+            if nombre == objetivo:
+                return True
+            if nombre in vistos:
+                continue
+            vistos.add(nombre)
+            celda = self._celdas.get(nombre)
+            if celda is not None:
+                pendientes.extend(celda[1])
+        return False
+
+    def _afectadas(self, origen):
+        # Celdas que dependen de origen, en orden topológico (Kahn)
+        afectadas = {origen}
+        cola = deque([origen])
+        while cola:
+            for dependiente in self._dependientes.get(cola.popleft(), ()):
+                if dependiente not in afectadas:
+                    afectadas.add(dependiente)
+                    cola.append(dependiente)
+
+        entradas = {nombre: 0 for nombre in afectadas}
+        for nombre in afectadas:
+            for dependiente in self._dependientes.get(nombre, ()):
+                entradas[dependiente] += 1
+        listas = deque(nombre for nombre, n in entradas.items() if n == 0)
+        orden = []
+        while listas:
+            nombre = listas.popleft()
+            orden.append(nombre)
+            for dependiente in self._dependientes.get(nombre, ()):
+                entradas[dependiente] -= 1
+                if entradas[dependiente] == 0:
+                    listas.append(dependiente)
+        return orden
+
+    def _recalcular(self, origen):
+        # El origen también entra aquí solo si su valor (o su error) cambió
+        cambiadas = set()
+        self.recalculadas = 0
+        for nombre in self._afectadas(origen):
+            codigo, dependencias = self._celdas[nombre]
+            if nombre != origen and cambiadas.isdisjoint(dependencias):
+                continue
+            self.recalculadas += 1
+            anterior = self.variables.get(nombre, self.errores.get(nombre))
+            try:
+                self.variables[nombre] = eval(codigo, _GLOBALES, self.variables)
+                self.errores.pop(nombre, None)
+                actual = self.variables[nombre]
+            except Exception as e:
+                self.variables.pop(nombre, None)
+                self.errores[nombre] = actual = f'{type(e).__name__}: {e}'
+            if actual != anterior or type(actual) is not type(anterior):
+                cambiadas.add(nombre)
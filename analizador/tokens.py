@@ -0,0 +1,260 @@
+import re
+from array import array
+from bisect import bisect_right
+
+# === Tipos de token ===
+# Enteros pequeños: el parser compara códigos en lugar de cadenas y caben en array('B')
+NUMBER, PLUS, MINUS, TIMES, DIVIDE, LPAREN, RPAREN, ASSIGN, ID, EOF, NEWLINE, INVALIDO = range(12)
+
+NOMBRES = ('NUMBER', 'PLUS', 'MINUS', 'TIMES', 'DIVIDE', 'LPAREN', 'RPAREN', 'ASSIGN', 'ID', 'EOF',
+           'NEWLINE', 'INVALIDO')
+# Nombres que usa la gramática de analizadorPLY (allí la asignación se llama EQUAL)
+NOMBRES_PLY = NOMBRES[:ASSIGN] + ('EQUAL',) + NOMBRES[ASSIGN + 1:]
+
+# === Token individual ===
+class Token:
+    # Vista de un token de la tabla: sin __dict__, y con los atributos que el
+    # parser de PLY lee de un LexToken (type, value, lineno, lexpos). PLY asigna
+    # 'lexer' al token que provoca un error de sintaxis
+    __slots__ = ('tipo', 'valor', 'linea', 'columna', 'posicion', 'lexer')
+
+    def __init__(self, tipo, valor, linea, columna, posicion):
+        self.tipo = tipo
+        self.valor = valor
+        self.linea = linea
+        self.columna = columna
+        self.posicion = posicion
+
+    @property
+    def type(self):
+        return NOMBRES_PLY[self.tipo]
+
+    @property
+    def value(self):
+        return self.valor
+
+    @property
+    def lineno(self):
+        return self.linea
+
+    @property
+    def lexpos(self):
+        return self.posicion
+
+    def __repr__(self):
+        return f'Token({NOMBRES[self.tipo]}, {self.valor!r}, línea {self.linea}, columna {self.columna})'
+
+# === Diagnósticos ===
+class Diagnostico:
+    # Un error de análisis: dónde ocurrió, qué tipos de token se esperaban y
+    # qué se encontró. Los parsers con recuperación juntan una lista de estos.
+    # Los esperados se guardan en orden alfabético, vengan del parser que vengan
+    __slots__ = ('linea', 'columna', 'esperados', 'encontrado')
+
+    def __init__(self, linea, columna, esperados, encontrado):
+        self.linea = linea
+        self.columna = columna
+        self.esperados = tuple(sorted(esperados))
+        self.encontrado = encontrado
+
+    def descripcion(self):
+        if not self.esperados:
+            return f'carácter no válido {self.encontrado}'
+        esperados = list(self.esperados)
+        if len(esperados) > 1:
+            esperados[-2:] = [f'{esperados[-2]} o {esperados[-1]}']
+        return f'se esperaba {", ".join(esperados)}, se encontró {self.encontrado}'
+
+    def __str__(self):
+        return f'Línea {self.linea}, columna {self.columna}: {self.descripcion()}'
+
+    def __repr__(self):
+        return f'Diagnostico({self.linea}, {self.columna}, {self.esperados!r}, {self.encontrado!r})'
+
+def crear_diagnostico(texto, posicion, esperados, encontrado):
+    # Línea y columna (desde 1) a partir de la posición en el texto
+    linea = texto.count('\n', 0, posicion) + 1
+    columna = posicion - texto.rfind('\n', 0, posicion)
+    return Diagnostico(linea, columna, esperados, encontrado)
+
+# === Tabla de tokens (estructura de arreglos) ===
+# El patrón cubre todo el texto, espacios incluidos, así la posición de cada
+# lexema es la suma de las longitudes anteriores
+_PATRON = re.compile(r'\s+|\d+(?:\.\d*)?|[^\W\d]\w*|[-+*/()=]|.', re.S)
+# Los mismos lexemas que el lexer de analizadorPLY: sin identificadores, solo
+# ignora ' ', '\t' y '\n', y cualquier otro carácter queda suelto (t_error)
+_PATRON_PLY = re.compile(r'[ \t\n]+|\d+(?:\.\d*)?|[-+*/()=]|.', re.S)
+
+_OPERADORES = {
+    '+': (PLUS, '+'), '-': (MINUS, '-'), '*': (TIMES, '*'), '/': (DIVIDE, '/'),
+    '(': (LPAREN, '('), ')': (RPAREN, ')'), '=': (ASSIGN, '='),
+}
+
+class Clasificacion(dict):
+    # Lexema -> (tipo, valor), o None para los espacios; cada lexema distinto
+    # se clasifica una vez y su valor se comparte entre todas sus apariciones
+    def __init__(self):
+        super().__init__(_OPERADORES)
+
+    def __missing__(self, lexema):
+        inicial = lexema[0]
+        if inicial.isspace():
+            clase = None
+        elif inicial.isdigit():
+            # Los enteros se convierten ya; los decimales quedan como texto para
+            # que cada parser elija su tipo (float, Decimal, Fraction) sin pérdida
+            clase = (NUMBER, lexema if '.' in lexema else int(lexema))
+        elif inicial.isalpha() or inicial == '_':
+            clase = (ID, lexema)
+        else:
+            clase = (INVALIDO, lexema)
+        self[lexema] = clase
+        return clase
+
+class ClasificacionPLY(Clasificacion):
+    # Como el lexer de analizadorPLY: no hay identificadores y solo se ignoran
+    # ' ', '\t' y '\n'. Esos lexemas quedan como un INVALIDO entero; el lexer de
+    # PLY los parte de otra forma ('x9.5' es x y 9.5), así que quien los
+    # encuentre debe volver a analizar el texto con ese lexer
+    def __missing__(self, lexema):
+        clase = super().__missing__(lexema)
+        if (clase is None and lexema.strip(' \t\n')) or (clase is not None and clase[0] == ID):
+            clase = self[lexema] = (INVALIDO, lexema)
+        return clase
+
+def lexemas(texto, inicio=0, clasificacion=None):
+    # Produce (posición, fin, tipo, valor) de cada token a partir de inicio,
+    # sin los espacios. Sirve para volver a tokenizar solo una parte del texto
+    if clasificacion is None:
+        clasificacion = Clasificacion()
+    for coincidencia in _PATRON.finditer(texto, inicio):
+        clase = clasificacion[coincidencia.group()]
+        if clase is not None:
+            yield coincidencia.start(), coincidencia.end(), clase[0], clase[1]
+
+class Tokens:
+    # Tabla de tokens con su posición en el texto, para los análisis que dan
+    # línea y columna (diagnosticar, LexerPLY). Un token ocupa un byte de tipo,
+    # cuatro de posición y una referencia a su valor; línea y columna se
+    # calculan al pedir el token. Sin posiciones, la lista de tuplas compartidas
+    # de LexerRegex ocupa menos y se arma más rápido
+    def __init__(self, texto, patron=_PATRON, clasificacion=None):
+        self.texto = texto
+        self.tipos = array('B')
+        self.valores = []
+        self.posiciones = array('I')
+        self.inicios_linea = array('I', [0])
+
+        if clasificacion is None:
+            clasificacion = Clasificacion()
+        tipos, valores, posiciones = self.tipos, self.valores, self.posiciones
+        posicion = 0
+        for lexema in patron.findall(texto):
+            clase = clasificacion[lexema]
+            if clase is not None:
+                tipos.append(clase[0])
+                valores.append(clase[1])
+                posiciones.append(posicion)
+            elif '\n' in lexema:
+                salto = lexema.find('\n')
+                while salto != -1:
+                    self.inicios_linea.append(posicion + salto + 1)
+                    salto = lexema.find('\n', salto + 1)
+            posicion += len(lexema)
+
+    def __len__(self):
+        return len(self.tipos)
+
+    def __getitem__(self, indice):
+        posicion = self.posiciones[indice]
+        linea, columna = self.linea_columna(posicion)
+        return Token(self.tipos[indice], self.valores[indice], linea, columna, posicion)
+
+    def __iter__(self):
+        for indice in range(len(self.tipos)):
+            yield self[indice]
+
+    def linea_columna(self, posicion):
+        # Ambas empiezan en 1
+        linea = bisect_right(self.inicios_linea, posicion)
+        return linea, posicion - self.inicios_linea[linea - 1] + 1
+
+    def fin(self):
+        # Token EOF situado justo después del texto
+        linea, columna = self.linea_columna(len(self.texto))
+        return Token(EOF, None, linea, columna, len(self.texto))
+
+# === Adaptadores para los dos analizadores ===
+class LexerTokens:
+    # Interfaz de Lexer (get_next_token) para Parser de AnalizadorAST: entrega
+    # tuplas (tipo, valor) y recuerda la posición para dar línea y columna.
+    # Si al_invalido es una función, los caracteres no válidos se le pasan
+    # (con su línea y columna) y se saltan en lugar de lanzar una excepción
+    def __init__(self, tokens, al_invalido=None):
+        self.tokens = tokens if isinstance(tokens, Tokens) else Tokens(tokens)
+        self.indice = -1
+        self.al_invalido = al_invalido
+        self.posicion = 0
+        self.pendientes = []  # (posición, tipo, valor) de las partes de un decimal, en orden inverso
+
+    def get_next_token(self):
+        while True:
+            if self.pendientes:
+                self.posicion, tipo, valor = self.pendientes.pop()
+            else:
+                self.indice += 1
+                if self.indice >= len(self.tokens):
+                    self.posicion = len(self.tokens.texto)
+                    return (EOF, None)
+                tipo = self.tokens.tipos[self.indice]
+                valor = self.tokens.valores[self.indice]
+                self.posicion = self.tokens.posiciones[self.indice]
+                if tipo == NUMBER and valor.__class__ is str:
+                    # La gramática de AnalizadorAST no tiene decimales: como Lexer y
+                    # LexerRegex, '1.5' se lee como 1, un '.' no válido y 5
+                    entero, _, fraccion = valor.partition('.')
+                    punto = self.posicion + len(entero)
+                    if fraccion:
+                        self.pendientes.append((punto + 1, NUMBER, int(fraccion)))
+                    self.pendientes.append((punto, INVALIDO, '.'))
+                    valor = int(entero)
+            if tipo == INVALIDO:
+                linea, columna = self.posicion_actual()
+                if self.al_invalido is None:
+                    raise Exception(f'Carácter no válido: {valor} (línea {linea}, columna {columna})')
+                self.al_invalido(linea, columna, valor)
+                continue
+            return (tipo, valor)
+
+    def posicion_actual(self):
+        return self.tokens.linea_columna(self.posicion)
+
+class LexerPLY:
+    # Interfaz de lexer de PLY (input/token) sobre la tabla de tokens, con los
+    # mismos tokens que analizadorPLY.lexer: las letras no forman identificadores,
+    # cada una es un carácter no válido. Esos caracteres se avisan y se saltan,
+    # como hace t_error; si diagnosticos es una lista, se anotan allí en lugar
+    # de imprimirse
+    def __init__(self, texto=''):
+        self.diagnosticos = None
+        self.input(texto)
+
+    def input(self, texto):
+        self.tokens = texto if isinstance(texto, Tokens) else Tokens(texto, _PATRON_PLY, ClasificacionPLY())
+        self.indice = 0
+
+    def token(self):
+        tokens = self.tokens
+        while self.indice < len(tokens):
+            token = tokens[self.indice]
+            self.indice += 1
+            if token.tipo != INVALIDO:
+                return token
+            if self.diagnosticos is None:
+                print(f"Carácter no reconocido {token.valor}")
+            else:
+                self.diagnosticos.append(Diagnostico(token.linea, token.columna, (), token.valor))
+        return None
+
+    def __iter__(self):
+        return iter(self.token, None)
@@ -0,0 +1,96 @@
+import ast
+
+import numpy as np
+
+from AnalizadorAST import LexerRegex, ParserIterativo
+from optimizador import optimizar
+
+# === Evaluación vectorizada con NumPy ===
+_OPERACIONES = {
+    ast.Add: np.add,
+    ast.Sub: np.subtract,
+    ast.Mult: np.multiply,
+}
+
+def _dividir(numerador, denominador, mascara):
+    # Las filas con denominador 0 quedan enmascaradas en lugar de producir inf/nan
+    ceros = np.equal(denominador, 0)
+    if np.any(ceros):
+        mascara = mascara | ceros
+        denominador = np.where(ceros, 1, denominador)
+    return np.true_divide(numerador, denominador), mascara
+
+def evaluar_columnas(expresion, columnas):
+    # expresion: texto o árbol de Parser.parse(); columnas: nombre -> arreglo o
+    # escalar. Las columnas se combinan con las reglas de difusión de NumPy (un
+    # escalar vale lo mismo en todas las filas). Devuelve un np.ma.MaskedArray
+    # con una fila por elemento de las columnas
+    if isinstance(expresion, str):
+        expresion = optimizar(ParserIterativo(LexerRegex(expresion)).parse())
+    raiz = expresion.body if isinstance(expresion, ast.Expression) else expresion
+    if isinstance(raiz, ast.Assign):
+        raiz = raiz.value
+
+    arreglos = {nombre: np.asarray(valores) for nombre, valores in columnas.items()}
+    formas = {nombre: arreglo.shape for nombre, arreglo in arreglos.items()}
+    try:
+        forma = np.broadcast_shapes(*formas.values())
+    except ValueError:
+        raise ValueError(f'Las columnas no tienen el mismo largo: {formas}') from None
+    if len(forma) > 1:
+        raise ValueError(f'Las columnas deben ser de una dimensión: {formas}')
+    filas = forma[0] if forma else 1
+    sin_mascara = np.zeros(filas, dtype=bool)
+
+    # Postorden con pila explícita. Cada subárbol recibe una clave estructural
+    # (los subárboles idénticos tienen la misma), así una subexpresión repetida
+    # se calcula una sola vez sobre las columnas
+    numeros = {}     # id(nodo) -> número de su clave
+    claves = {}      # clave estructural -> número
+    resultados = []  # número -> (valores, máscara)
+    pila = [raiz]
+    while pila:
+        node = pila[-1]
+        if id(node) in numeros:
+            pila.pop()
+            continue
+        if isinstance(node, ast.Constant):
+            clave = ('C', type(node.value), node.value)
+        elif isinstance(node, ast.Name):
+            if node.id not in arreglos:
+                raise Exception(f'Variable sin columna: {node.id}')
+            clave = ('N', node.id)
+        elif isinstance(node, ast.BinOp):
+            izquierda = numeros.get(id(node.left))
+            derecha = numeros.get(id(node.right))
+            if izquierda is None or derecha is None:
+                pila.append(node.right)
+                pila.append(node.left)
+                continue
+            clave = (type(node.op), izquierda, derecha)
+        else:
+            raise Exception(f'Nodo no soportado: {type(node).__name__}')
+        pila.pop()
+
+        numero = claves.get(clave)
+        if numero is None:
+            if clave[0] == 'C':
+                resultado = (node.value, sin_mascara)
+            elif clave[0] == 'N':
+                resultado = (arreglos[node.id], sin_mascara)
+            else:
+                izquierda, derecha = resultados[clave[1]], resultados[clave[2]]
+                mascara = izquierda[1] | derecha[1]
+                if isinstance(node.op, ast.Div):
+                    valores, mascara = _dividir(izquierda[0], derecha[0], mascara)
+                else:
+                    valores = _OPERACIONES[type(node.op)](izquierda[0], derecha[0])
+                resultado = (valores, mascara)
+            numero = claves[clave] = len(resultados)
+            resultados.append(resultado)
+        numeros[id(node)] = numero
+
+    valores, mascara = resultados[numeros[id(raiz)]]
+    if np.ndim(valores) == 0:
+        valores = np.full(filas, valores)
+    return np.ma.MaskedArray(valores, mask=mascara)
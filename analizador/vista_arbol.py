@@ -0,0 +1,95 @@
+import ast
+
+# === Vista perezosa de un árbol ast ===
+TAMANO_PAGINA = 100  # Elementos de una lista que se muestran al expandirla
+SANGRIA = '  '
+
+def _es_hoja(valor):
+    # Nodos que caben en una línea: ningún campo es una lista ni un nodo con campos
+    # propios (Load(), Add() y similares sí cuentan como parte de la línea)
+    for campo in valor._fields:
+        hijo = getattr(valor, campo, None)
+        if isinstance(hijo, list) or (isinstance(hijo, ast.AST) and hijo._fields):
+            return False
+    return True
+
+def _expandible(valor):
+    if isinstance(valor, list):
+        return bool(valor)
+    return isinstance(valor, ast.AST) and not _es_hoja(valor)
+
+class _Mas:
+    # Fila "… N más" de una lista paginada: al abrirla muestra la página siguiente
+    __slots__ = ('lista', 'desde')
+
+    def __init__(self, lista, desde):
+        self.lista = lista
+        self.desde = desde
+
+class VistaArbol:
+    # Cada fila es [nivel, campo, valor, abierta] y solo existen las filas de
+    # los nodos expandidos; el texto de una fila se arma al pedirla. Al empezar
+    # hay una fila por campo de la raíz, sea cual sea el tamaño del árbol, y
+    # ast.dump solo se llama sobre hojas
+    def __init__(self, tree):
+        self.filas = [[0, None, tree, False]]
+        self.alternar(0)
+
+    @property
+    def total_lineas(self):
+        return len(self.filas)
+
+    def _hijos(self, valor):
+        if isinstance(valor, _Mas):
+            lista, desde = valor.lista, valor.desde
+        elif isinstance(valor, list):
+            lista, desde = valor, 0
+        else:
+            return [(campo, getattr(valor, campo)) for campo in valor._fields
+                    if getattr(valor, campo, None) is not None]
+        hasta = min(len(lista), desde + TAMANO_PAGINA)
+        hijos = [(f'[{i}]', lista[i]) for i in range(desde, hasta)]
+        if hasta < len(lista):
+            hijos.append((None, _Mas(lista, hasta)))
+        return hijos
+
+    def alternar(self, indice):
+        # Abre o cierra la fila; devuelve False si no se puede expandir
+        nivel, campo, valor, abierta = self.filas[indice]
+        if isinstance(valor, _Mas):
+            # La página siguiente reemplaza a la fila "… N más"
+            nuevas = [[nivel, c, v, False] for c, v in self._hijos(valor)]
+            self.filas[indice:indice + 1] = nuevas
+            return True
+        if not _expandible(valor):
+            return False
+        if abierta:
+            fin = indice + 1
+            while fin < len(self.filas) and self.filas[fin][0] > nivel:
+                fin += 1
+            del self.filas[indice + 1:fin]
+        else:
+            self.filas[indice + 1:indice + 1] = [[nivel + 1, c, v, False] for c, v in self._hijos(valor)]
+        self.filas[indice][3] = not abierta
+        return True
+
+    def linea(self, indice):
+        nivel, campo, valor, abierta = self.filas[indice]
+        sangria = SANGRIA * nivel
+        if isinstance(valor, _Mas):
+            return f'{sangria}▸ … {len(valor.lista) - valor.desde:,} más'
+        prefijo = f'{campo}=' if campo is not None else ''
+        if isinstance(valor, list):
+            marca = '▾' if abierta else '▸'
+            return f'{sangria}{marca} {prefijo}[{len(valor):,} elementos]' if valor else f'{sangria}  {prefijo}[]'
+        if isinstance(valor, ast.AST):
+            if _es_hoja(valor):
+                return f'{sangria}  {prefijo}{ast.dump(valor)}'
+            marca = '▾' if abierta else '▸'
+            resumen = '' if abierta else '(…)'
+            return f'{sangria}{marca} {prefijo}{type(valor).__name__}{resumen}'
+        return f'{sangria}  {prefijo}{valor!r}'
+
+    def lineas(self, primera, cantidad):
+        return [self.linea(i) for i in range(primera, min(primera + cantidad, len(self.filas)))]
+